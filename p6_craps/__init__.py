@@ -1,16 +1,26 @@
 """Craps simulation core package."""
 
-from p6_craps.dice import Dice, Roll
-from p6_craps.engine import CrapsEngine, RollResult
+from p6_craps.batched import run_lanes
+from p6_craps.dice import (
+    Dice,
+    ReplayDice,
+    Roll,
+    RollSource,
+    default_rng,
+    write_roll_stream,
+)
+from p6_craps.engine import CrapsEngine, RollHistory, RollResult
 from p6_craps.enums import PassLineOutcome, Phase
 from p6_craps.game import Game, GameConfig, GameStep, GameStopReason, PlayerState
 from p6_craps.models import Bankroll, Player, Table
-from p6_craps.render import render_stats
+from p6_craps.render import render_run_summary, render_stats
 from p6_craps.simulate import (
     SimulationConfig,
     default_players,
     game_config_from_config,
     players_from_config,
+    run_many,
+    run_many_stats,
     run_simulation,
     run_until_complete,
     simulation_config_from_config,
@@ -38,21 +48,30 @@ __all__ = [
     "MartingaleStrategy",
     "PassLineOutcome",
     "Phase",
+    "ReplayDice",
     "ParoliStrategy",
     "PlayerState",
     "Player",
     "Roll",
+    "RollHistory",
     "RollResult",
+    "RollSource",
     "SimulationConfig",
     "StatsSnapshot",
     "Table",
     "TableStatsCollector",
     "default_players",
+    "default_rng",
     "game_config_from_config",
     "percent",
     "players_from_config",
+    "render_run_summary",
     "render_stats",
+    "run_lanes",
+    "run_many",
+    "run_many_stats",
     "run_simulation",
     "run_until_complete",
     "simulation_config_from_config",
+    "write_roll_stream",
 ]
@@ -0,0 +1,78 @@
+"""Lockstep simulation of many independent pass-line games."""
+
+from __future__ import annotations
+
+import random
+from typing import List, Optional, Tuple
+
+from p6_craps.dice import Dice, RollSource, default_rng
+from p6_craps.engine import _TRANSITIONS
+from p6_craps.game import GameConfig
+
+# Integer-only view of the engine transitions: ``(point_after or 0, completed)`` by [point or 0][total].
+_LANE_TRANSITIONS: Tuple[Tuple[Optional[Tuple[int, int]], ...], ...] = tuple(
+    tuple(None if entry is None else (entry[1] or 0, entry[3]) for entry in row) for row in _TRANSITIONS
+)
+
+
+def run_lanes(
+    game_config: GameConfig,
+    games: int,
+    lanes: int = 64,
+    rng: Optional[random.Random] = None,
+    dice: Optional[RollSource] = None,
+) -> List[Tuple[int, int]]:
+    """Play ``games`` dice-only games across ``lanes`` interleaved slots.
+
+    Each lane holds one game's point, points made, and roll count as plain ints
+    in parallel lists, and every tick advances each live lane by one roll from a
+    shared dice source. A finished lane is reset in place to start the next game
+    until ``games`` have been played. Lanes have no players, so only the
+    ``target_points`` and ``max_rolls`` limits apply. Returns ``(roll_count,
+    points_made)`` per game in start order.
+    """
+    if game_config.target_points is None and game_config.max_rolls is None:
+        raise ValueError("game_config must set target_points or max_rolls")
+    if games < 0:
+        raise ValueError(f"games must be non-negative, got {games}")
+    if lanes <= 0:
+        raise ValueError("lanes must be positive")
+    if dice is not None and rng is not None:
+        raise ValueError("Provide either dice or rng, not both")
+    roll = (dice if dice is not None else Dice(rng=rng or default_rng())).roll
+    transitions = _LANE_TRANSITIONS
+    target_points = game_config.target_points
+    max_rolls = game_config.max_rolls
+
+    width = min(lanes, games)
+    lane_game = list(range(width))
+    point = [0] * width
+    completed = [0] * width
+    rolls = [0] * width
+    results: List[Tuple[int, int]] = [(0, 0)] * games
+    next_game = width
+    live = width
+    while live:
+        for lane in range(width):
+            game_id = lane_game[lane]
+            if game_id < 0:
+                continue
+            point_after, made = transitions[point[lane]][roll().total]
+            point[lane] = point_after
+            lane_completed = completed[lane] + made
+            completed[lane] = lane_completed
+            lane_rolls = rolls[lane] + 1
+            rolls[lane] = lane_rolls
+            if (target_points is None or lane_completed < target_points) and (
+                max_rolls is None or lane_rolls < max_rolls
+            ):
+                continue
+            results[game_id] = (lane_rolls, lane_completed)
+            if next_game < games:
+                lane_game[lane] = next_game
+                next_game += 1
+                point[lane] = completed[lane] = rolls[lane] = 0
+            else:
+                lane_game[lane] = -1
+                live -= 1
+    return results
@@ -0,0 +1,230 @@
+"""Command-line orchestration for the craps simulator."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+from p6_craps.render import render_run_summary
+from p6_craps.simulate import (
+    game_config_from_config,
+    players_from_config,
+    run_many,
+    run_simulation,
+    simulation_config_from_config,
+)
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_CONFIG_PATH = "config.json"
+VERSION = "0.0.1"
+
+
+def setup_logging(debug: bool, verbose: bool) -> None:
+    """
+    Set up logging based on the debug and verbose flags.
+
+    Args:
+        debug: Enable debug logging if True.
+        verbose: Enable info logging if True.
+    """
+    if debug:
+        logging.basicConfig(level=logging.DEBUG)
+    elif verbose:
+        logging.basicConfig(level=logging.INFO)
+    else:
+        logging.basicConfig(level=logging.WARNING)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a craps simulation based on command-line arguments."""
+    namespace = PARSER.parse_args(argv)
+    setup_logging(debug=namespace.debug, verbose=namespace.verbose)
+
+    try:
+        cli = CliArgs.from_args(vars(namespace))
+    except ConfigError as exc:
+        LOGGER.error("Invalid arguments: %s", exc)
+        return 1
+
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(
+            "Starting simulation",
+            extra={
+                "config_path": cli.config_path,
+                "max_rolls": cli.max_rolls,
+                "clear": cli.clear,
+                "frame_delay": cli.frame_delay,
+                "render_every": cli.render_every,
+            },
+        )
+
+    try:
+        cfg = load_config(cli.config_path)
+    except ConfigError as exc:
+        LOGGER.error("Failed to load config: %s", exc)
+        return 1
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Loaded config", extra={"config_keys": sorted(cfg)})
+
+    players = players_from_config(cfg)
+    game_config = game_config_from_config(cfg, max_rolls=cli.max_rolls)
+    if cli.runs is not None:
+        seeds = range(cli.seed, cli.seed + cli.runs)
+        try:
+            results = run_many(players, game_config, seeds=seeds, jobs=cli.jobs)
+        except ValueError as exc:
+            LOGGER.error("Simulation failed: %s", exc)
+            return 1
+        sys.stdout.write(render_run_summary(results) + "\n")
+        return 0
+    sim_config = simulation_config_from_config(
+        cfg,
+        frame_delay=cli.frame_delay,
+        clear=cli.clear,
+        render_every=cli.render_every,
+        interactive=sys.stdout.isatty(),
+    )
+    try:
+        return run_simulation(players, game_config=game_config, sim_config=sim_config)
+    except ValueError as exc:
+        LOGGER.error("Simulation failed: %s", exc)
+        return 1
+
+
+class ConfigError(RuntimeError):
+    """Raised when configuration loading fails."""
+
+
+def load_config(path: str) -> dict[str, Any]:
+    """Load JSON configuration from disk."""
+    if not path:
+        raise ConfigError("Config path is required")
+    config_path = Path(path)
+    if not config_path.exists():
+        return {}
+    try:
+        data = json.loads(config_path.read_bytes())
+    except OSError as exc:
+        raise ConfigError(f"Failed to read config: {exc}") from exc
+    except json.JSONDecodeError as exc:
+        raise ConfigError(f"Invalid JSON config: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ConfigError("Config must be a JSON object")
+    return data
+
+
+@dataclass(slots=True, frozen=True)
+class CliArgs:
+    """Typed, validated view of the parsed command-line options."""
+
+    config_path: str = DEFAULT_CONFIG_PATH
+    max_rolls: int | None = None
+    frame_delay: float = 0.0
+    clear: bool = True
+    render_every: int | None = None
+    runs: int | None = None
+    jobs: int = 1
+    seed: int = 0
+
+    @classmethod
+    def from_args(cls, args: Mapping[str, Any]) -> CliArgs:
+        """Coerce every option in one pass, reporting all invalid values together."""
+        values: dict[str, Any] = {}
+        errors: list[str] = []
+        for attr, (option, _, coerce, default, _) in _ARG_SCHEMA.items():
+            raw = args.get(attr)
+            if raw is None:
+                values[attr] = default
+                continue
+            try:
+                values[attr] = coerce(raw)
+            except ValueError as exc:
+                errors.append(f"{option} {exc}")
+        if errors:
+            raise ConfigError("; ".join(errors))
+        values["clear"] = not bool(args.get("no_clear", False))
+        return cls(**values)
+
+
+def _to_int(value: Any) -> int:
+    """Coerce an option to an integer."""
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"must be an integer, got {value!r}") from exc
+
+
+def _to_positive_int(value: Any) -> int:
+    """Coerce an option to a positive integer."""
+    parsed = _to_int(value)
+    if parsed <= 0:
+        raise ValueError("must be positive")
+    return parsed
+
+
+def _to_non_negative_int(value: Any) -> int:
+    """Coerce an option to a non-negative integer."""
+    parsed = _to_int(value)
+    if parsed < 0:
+        raise ValueError("must be non-negative")
+    return parsed
+
+
+def _to_non_negative_float(value: Any) -> float:
+    """Coerce an option to a non-negative number."""
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"must be a number, got {value!r}") from exc
+    if parsed < 0:
+        raise ValueError("must be non-negative")
+    return parsed
+
+
+# CliArgs attribute -> (option, metavar, coercion, default when absent, help text).
+_ARG_SCHEMA: dict[str, tuple[str, str, Callable[[Any], Any], Any, str]] = {
+    "config_path": (
+        "--config",
+        "PATH",
+        str,
+        DEFAULT_CONFIG_PATH,
+        f"Path to config file [default: {DEFAULT_CONFIG_PATH}].",
+    ),
+    "max_rolls": ("--max-rolls", "N", _to_positive_int, None, "Stop after at most N rolls (safety guard)."),
+    "frame_delay": ("--frame-delay", "SECONDS", _to_non_negative_float, 0.0, "Sleep this many seconds between frames."),
+    "render_every": (
+        "--render-every",
+        "N",
+        _to_non_negative_int,
+        None,
+        "Render every Nth roll; 0 renders only the final frame. Defaults to 1 on a terminal and 0 otherwise.",
+    ),
+    "runs": ("--runs", "N", _to_positive_int, None, "Run N independent headless games and print a summary."),
+    "jobs": ("--jobs", "K", _to_positive_int, 1, "Worker processes for --runs [default: 1]."),
+    "seed": ("--seed", "S", _to_int, 0, "Base seed for --runs; game i uses S + i [default: 0]."),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser from the option schema.
+
+    Option values are left as strings so ``CliArgs.from_args`` can validate them
+    all at once and report every problem together.
+    """
+    parser = argparse.ArgumentParser(prog="script.py", description="p6-craps-py - Craps simulation CLI.")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--debug", action="store_true", help="Enable debug logging.")
+    verbosity.add_argument("--verbose", action="store_true", help="Enable verbose logging.")
+    parser.add_argument("--no-clear", action="store_true", help="Do not clear the terminal between frames.")
+    for attr, (option, metavar, _, _, help_text) in _ARG_SCHEMA.items():
+        parser.add_argument(option, dest=attr, metavar=metavar, help=help_text)
+    parser.add_argument("--version", action="version", version=f"%(prog)s {VERSION}")
+    return parser
+
+
+PARSER = build_parser()
@@ -2,36 +2,178 @@
 
 from __future__ import annotations
 
+import mmap
 import random
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, Tuple, Union
 
 
-@dataclass(slots=True, frozen=True)
+@dataclass(frozen=True)
 class Roll:
-    """Immutable dice roll."""
+    """Immutable dice roll.
+
+    ``total`` is the sum of both dice, stored once at construction in an extra
+    slot so reading it is a plain attribute access. It is not a dataclass field,
+    so ``fields``, ``astuple`` and ``asdict`` see only ``d1`` and ``d2``.
+    """
+
+    __slots__ = ("d1", "d2", "total")
 
     d1: int
     d2: int
+    if TYPE_CHECKING:
+        total: int
 
     def __post_init__(self) -> None:
-        """Validate die values are within standard range."""
-        if not 1 <= self.d1 <= 6:
-            raise ValueError(f"d1 must be between 1 and 6, got {self.d1}")
-        if not 1 <= self.d2 <= 6:
-            raise ValueError(f"d2 must be between 1 and 6, got {self.d2}")
+        """Store the total and validate die values (validation is skipped under ``python -O``)."""
+        if __debug__ and not (1 <= self.d1 <= 6 and 1 <= self.d2 <= 6):
+            raise ValueError(f"Dice must be between 1 and 6, got ({self.d1}, {self.d2})")
+        object.__setattr__(self, "total", self.d1 + self.d2)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle as the two dice, rebuilding the total on load."""
+        return (type(self), (self.d1, self.d2))
+
+
+ALL_ROLLS: Tuple[Roll, ...] = tuple(Roll(d1=d1, d2=d2) for d1 in range(1, 7) for d2 in range(1, 7))
+_ROLL_TOTALS: Tuple[int, ...] = tuple(roll.total for roll in ALL_ROLLS)
+
+# Random bytes map onto ALL_ROLLS indices: 252 = 7 * 36, so bytes below it hit each
+# of the 36 rolls exactly seven times; the four bytes at or above it are discarded.
+_BYTE_TO_ROLL_INDEX = bytes(value % 36 for value in range(252)) + bytes(4)
+_REJECTED_BYTES = bytes(range(252, 256))
+
+_THREAD_RNG = threading.local()
+
+
+def default_rng() -> random.Random:
+    """Return this thread's shared unseeded RNG, creating it on first use.
 
-    @property
-    def total(self) -> int:
-        """Return the sum of both dice."""
-        return self.d1 + self.d2
+    Seeding a fresh ``random.Random()`` from OS entropy costs more than many
+    short games take to play, so engines built without an RNG share one per
+    thread. Pass an explicit ``random.Random(seed)`` for reproducible runs.
+    """
+    rng = getattr(_THREAD_RNG, "rng", None)
+    if rng is None:
+        rng = _THREAD_RNG.rng = random.Random()
+    return rng
 
 
 @dataclass(slots=True)
 class Dice:
-    """Standard two-dice roller with injectable RNG."""
+    """Standard two-dice roller with injectable RNG.
+
+    Rolls are drawn about ``block_size`` at a time as random bytes mapped onto the
+    36 equally likely outcomes, so each call to ``roll`` is a buffer read rather
+    than two RNG calls.
+    """
 
     rng: random.Random
+    block_size: int = 1024
+    _buffer: bytes = field(default=b"", init=False, repr=False)
+    _index: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the draw block size."""
+        if self.block_size <= 0:
+            raise ValueError(f"block_size must be positive, got {self.block_size}")
 
     def roll(self) -> Roll:
-        """Roll two dice using the configured RNG."""
-        return Roll(d1=self.rng.randint(1, 6), d2=self.rng.randint(1, 6))
+        """Return the next roll, refilling the buffer from the RNG when empty."""
+        while self._index >= len(self._buffer):
+            self._refill()
+        roll = ALL_ROLLS[self._buffer[self._index]]
+        self._index += 1
+        return roll
+
+    def roll_total(self) -> int:
+        """Return the total of the next roll without building or touching a ``Roll``.
+
+        Draws from the same buffer as ``roll``, so mixing the two keeps a seeded
+        stream in step.
+        """
+        while self._index >= len(self._buffer):
+            self._refill()
+        total = _ROLL_TOTALS[self._buffer[self._index]]
+        self._index += 1
+        return total
+
+    def _refill(self) -> None:
+        """Draw the next block of random bytes and map them onto roll indices."""
+        self._buffer = self.rng.randbytes(self.block_size).translate(_BYTE_TO_ROLL_INDEX, _REJECTED_BYTES)
+        self._index = 0
+
+
+class RollSource(Protocol):
+    """Anything that can produce the next dice roll."""
+
+    def roll(self) -> Roll:
+        """Return the next roll."""
+
+
+@dataclass(slots=True)
+class ReplayDice:
+    """Replay a recorded roll stream of ``(d1, d2)`` byte pairs.
+
+    Streams loaded with ``from_file`` are memory-mapped, so long recordings are
+    paged in lazily and never parsed into Python objects up front. Call ``close``
+    or use the replay as a context manager to release the mapping.
+    """
+
+    data: Union[bytes, mmap.mmap]
+    _index: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the stream holds whole rolls."""
+        if len(self.data) % 2:
+            raise ValueError("Roll stream must contain an even number of bytes")
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> ReplayDice:
+        """Memory-map a roll stream written by ``write_roll_stream``."""
+        with open(path, "rb") as handle:
+            if not handle.seek(0, 2):
+                return cls(data=b"")
+            return cls(data=mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __enter__(self) -> ReplayDice:
+        """Return this replay for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release the memory map on leaving a ``with`` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map backing a stream loaded with ``from_file``."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __len__(self) -> int:
+        """Return the number of rolls in the stream."""
+        return len(self.data) // 2
+
+    def roll(self) -> Roll:
+        """Return the next recorded roll."""
+        index = self._index
+        if index >= len(self.data):
+            raise IndexError("Roll stream exhausted")
+        d1 = self.data[index]
+        d2 = self.data[index + 1]
+        if not (1 <= d1 <= 6 and 1 <= d2 <= 6):
+            raise ValueError(f"Roll stream has invalid dice at roll {index // 2}: ({d1}, {d2})")
+        self._index = index + 2
+        return ALL_ROLLS[(d1 - 1) * 6 + d2 - 1]
+
+
+def write_roll_stream(path: Union[str, Path], source: RollSource, count: int) -> None:
+    """Record ``count`` rolls from ``source`` as a replayable byte stream."""
+    if count < 0:
+        raise ValueError(f"count must be non-negative, got {count}")
+    buffer = bytearray()
+    for _ in range(count):
+        roll = source.roll()
+        buffer += bytes((roll.d1, roll.d2))
+    Path(path).write_bytes(buffer)
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import random
+from array import array
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
+from itertools import compress
+from operator import add
+from typing import Iterator, List, Optional, Tuple
 
-from p6_craps.dice import Dice, Roll
+from p6_craps.dice import Dice, Roll, RollSource, default_rng
 from p6_craps.enums import PassLineOutcome, Phase
 
 
@@ -22,14 +26,132 @@ class RollResult:
     pass_line_outcome: PassLineOutcome
 
 
+# Module-level aliases let the hot path compare enum members by identity.
+_COME_OUT = Phase.COME_OUT
+_POINT_ON = Phase.POINT_ON
+_WIN = PassLineOutcome.WIN
+_LOSS = PassLineOutcome.LOSS
+_PUSH = PassLineOutcome.PUSH
+
+# Come-out pass line outcome indexed by roll total (indices 0 and 1 are not valid totals).
+_COME_OUT_OUTCOMES: Tuple[Optional[PassLineOutcome], ...] = (
+    None,
+    None,
+    _LOSS,
+    _LOSS,
+    _PUSH,
+    _PUSH,
+    _PUSH,
+    _WIN,
+    _PUSH,
+    _PUSH,
+    _PUSH,
+    _WIN,
+    _LOSS,
+)
+
+_Transition = Tuple[Phase, Optional[int], PassLineOutcome, int]
+
+
+def _transition(point: Optional[int], total: int) -> _Transition:
+    """Return ``(phase_after, point_after, outcome, completed)`` for a roll total."""
+    if not 2 <= total <= 12:
+        raise ValueError(f"Invalid roll total {total}")
+    if point is None:
+        outcome = _COME_OUT_OUTCOMES[total]
+        if outcome is _PUSH:
+            return _POINT_ON, total, outcome, 0
+        return _COME_OUT, None, outcome, 0
+    if total == point:
+        return _COME_OUT, None, _WIN, 1
+    if total == 7:
+        return _COME_OUT, None, _LOSS, 0
+    return _POINT_ON, point, _PUSH, 0
+
+
+# Every engine transition indexed by [point or 0][total]; rows 1-3 are unused, and
+# totals 0 and 1 hold ``None`` so a lookup for them falls back to ``_transition``.
+_TRANSITIONS: Tuple[Tuple[Optional[_Transition], ...], ...] = tuple(
+    (None, None, *(_transition(point or None, total) for total in range(2, 13))) for point in range(11)
+)
+
+_PHASES: Tuple[Phase, ...] = (Phase.COME_OUT, Phase.POINT_ON)
+_OUTCOMES: Tuple[PassLineOutcome, ...] = (PassLineOutcome.WIN, PassLineOutcome.LOSS, PassLineOutcome.PUSH)
+_PHASE_CODES = {phase: code for code, phase in enumerate(_PHASES)}
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(_OUTCOMES)}
+
+
+class RollHistory:
+    """Column-oriented record of roll results.
+
+    Each field is kept in its own compact ``array`` of small integers rather than
+    retaining one ``RollResult`` object per roll. A point of ``0`` means no point.
+    """
+
+    __slots__ = ("d1", "d2", "phase_before", "phase_after", "point_before", "point_after", "outcome")
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.d1 = array("b")
+        self.d2 = array("b")
+        self.phase_before = array("b")
+        self.phase_after = array("b")
+        self.point_before = array("b")
+        self.point_after = array("b")
+        self.outcome = array("b")
+
+    def __len__(self) -> int:
+        """Return the number of recorded rolls."""
+        return len(self.d1)
+
+    def append(self, result: RollResult) -> None:
+        """Record a roll result as one row across all columns."""
+        self.d1.append(result.roll.d1)
+        self.d2.append(result.roll.d2)
+        self.phase_before.append(_PHASE_CODES[result.phase_before])
+        self.phase_after.append(_PHASE_CODES[result.phase_after])
+        self.point_before.append(result.point_before or 0)
+        self.point_after.append(result.point_after or 0)
+        self.outcome.append(_OUTCOME_CODES[result.pass_line_outcome])
+
+    def total_counts(self, phase: Optional[Phase] = None) -> List[int]:
+        """Return how often each total was rolled, as a list indexed by total.
+
+        ``phase`` limits the count to rolls made in that phase. The histogram is
+        built straight from the dice columns without rebuilding any results.
+        """
+        totals: Iterator[int] = map(add, self.d1, self.d2)
+        if phase is not None:
+            totals = compress(totals, map(_PHASE_CODES[phase].__eq__, self.phase_before))
+        counts = [0] * 13
+        for total, count in Counter(totals).items():
+            counts[total] = count
+        return counts
+
+    def get_result(self, index: int) -> RollResult:
+        """Rebuild the ``RollResult`` stored at ``index``."""
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Roll index out of range: {index}")
+        return RollResult(
+            roll=Roll(d1=self.d1[index], d2=self.d2[index]),
+            phase_before=_PHASES[self.phase_before[index]],
+            phase_after=_PHASES[self.phase_after[index]],
+            point_before=self.point_before[index] or None,
+            point_after=self.point_after[index] or None,
+            pass_line_outcome=_OUTCOMES[self.outcome[index]],
+        )
+
+
 class CrapsEngine:
     """Craps rules engine for standard Las Vegas gameplay."""
 
-    def __init__(self, rng: Optional[random.Random] = None, dice: Optional[Dice] = None) -> None:
+    __slots__ = ("_dice", "phase", "point", "completed_points")
+
+    def __init__(self, rng: Optional[random.Random] = None, dice: Optional[RollSource] = None) -> None:
         """Initialize engine with optional RNG or Dice."""
         if dice is not None and rng is not None:
             raise ValueError("Provide either dice or rng, not both")
-        self._dice = dice or Dice(rng=rng or random.Random())
+        self._dice: RollSource = dice if dice is not None else Dice(rng=rng or default_rng())
         self.phase = Phase.COME_OUT
         self.point: Optional[int] = None
         self.completed_points = 0
@@ -38,52 +160,51 @@ class CrapsEngine:
         """Roll the dice and apply the outcome to the game state."""
         return self.apply_roll(self._dice.roll())
 
+    def run_batch(self, n: int) -> Tuple[RollResult, ...]:
+        """Roll the dice ``n`` times and return every result in order.
+
+        The loop binds the dice roller and rule step to locals so long runs avoid
+        repeated attribute lookups on each iteration.
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        roll = self._dice.roll
+        apply_roll = self.apply_roll
+        return tuple(apply_roll(roll()) for _ in range(n))
+
+    def run_history(self, n: int, history: Optional[RollHistory] = None) -> RollHistory:
+        """Roll the dice ``n`` times, appending each result to a ``RollHistory``."""
+        if n < 0:
+            raise ValueError(f"n must be non-negative, got {n}")
+        history = history if history is not None else RollHistory()
+        roll = self._dice.roll
+        apply_roll = self.apply_roll
+        append = history.append
+        for _ in range(n):
+            append(apply_roll(roll()))
+        return history
+
     def apply_roll(self, roll: Roll) -> RollResult:
         """Apply a roll to the current state and return the result."""
         phase_before = self.phase
         point_before = self.point
-        total = roll.total
-
-        if self.phase == Phase.COME_OUT:
-            if total in (7, 11):
-                outcome = PassLineOutcome.WIN
-                phase_after = Phase.COME_OUT
-                point_after = None
-            elif total in (2, 3, 12):
-                outcome = PassLineOutcome.LOSS
-                phase_after = Phase.COME_OUT
-                point_after = None
-            elif total in (4, 5, 6, 8, 9, 10):
-                outcome = PassLineOutcome.PUSH
-                phase_after = Phase.POINT_ON
-                point_after = total
-            else:
-                raise ValueError(f"Invalid roll total {total}")
+
+        if phase_before is _COME_OUT:
+            state = 0
+        elif point_before is None:
+            raise ValueError("Point must be set in POINT_ON phase")
         else:
-            if self.point is None:
-                raise ValueError("Point must be set in POINT_ON phase")
-            if total == self.point:
-                outcome = PassLineOutcome.WIN
-                phase_after = Phase.COME_OUT
-                point_after = None
-                self.completed_points += 1
-            elif total == 7:
-                outcome = PassLineOutcome.LOSS
-                phase_after = Phase.COME_OUT
-                point_after = None
-            else:
-                outcome = PassLineOutcome.PUSH
-                phase_after = Phase.POINT_ON
-                point_after = self.point
+            state = point_before
+        try:
+            phase_after, point_after, outcome, completed = _TRANSITIONS[state][roll.total]
+        except (IndexError, TypeError):
+            # Only reached for totals outside 2-12, which the table does not cover.
+            _transition(point_before, roll.total)
+            raise
 
         self.phase = phase_after
         self.point = point_after
+        self.completed_points += completed
 
-        return RollResult(
-            roll=roll,
-            phase_before=phase_before,
-            phase_after=phase_after,
-            point_before=point_before,
-            point_after=point_after,
-            pass_line_outcome=outcome,
-        )
+        # Positional arguments: this runs once per roll, and keyword parsing costs extra.
+        return RollResult(roll, phase_before, phase_after, point_before, point_after, outcome)
@@ -5,9 +5,9 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Protocol, Tuple
+from typing import Callable, List, NamedTuple, Optional, Protocol, Sequence, Tuple
 
-from p6_craps.dice import Dice
+from p6_craps.dice import RollSource
 from p6_craps.engine import CrapsEngine, RollResult
 from p6_craps.enums import PassLineOutcome, Phase
 from p6_craps.models import Player, Table
@@ -23,6 +23,11 @@ class StatsCollector(Protocol):
     def record_roll(self, roll_result: RollResult, shooter_index: int, roll_count: int, table: Table) -> None:
         """Record a single roll."""
 
+    def record_roll_batch(
+        self, results: Sequence[RollResult], shooters: Sequence[int], roll_count: int, table: Table
+    ) -> None:
+        """Record parallel columns of roll results and shooter seats ending at ``roll_count``."""
+
     def record_game_end(self, reason: GameStopReason, roll_count: int, points_made: int) -> None:
         """Record the end of a game."""
 
@@ -36,10 +41,46 @@ class NullStatsCollector:
     def record_roll(self, roll_result: RollResult, shooter_index: int, roll_count: int, table: Table) -> None:
         """Ignore roll."""
 
+    def record_roll_batch(
+        self, results: Sequence[RollResult], shooters: Sequence[int], roll_count: int, table: Table
+    ) -> None:
+        """Ignore roll batch."""
+
     def record_game_end(self, reason: GameStopReason, roll_count: int, points_made: int) -> None:
         """Ignore game end."""
 
 
+def _next_seat(mask: int, current_index: int) -> int:
+    """Return the next seat after ``current_index`` whose bit is set in ``mask``, or -1."""
+    for offset in range(1, 10):
+        seat_index = (current_index + offset) % 9
+        if mask >> seat_index & 1:
+            return seat_index
+    return -1
+
+
+_POINT_ON = Phase.POINT_ON
+_LOSS = PassLineOutcome.LOSS
+_PUSH = PassLineOutcome.PUSH
+
+# Rolls buffered by ``Game.run`` before they are handed to the stats collector.
+_STATS_BATCH_SIZE = 4096
+
+# Next shooter seat indexed by [shooter_mask * 9 + current_index]; -1 when no seat can shoot.
+_NEXT_SHOOTER: Tuple[int, ...] = tuple(_next_seat(mask, index) for mask in range(1 << 9) for index in range(9))
+
+
+def _validate_seating(table: Table, player_states: Tuple[Optional[PlayerState], ...]) -> None:
+    """Raise if ``player_states`` does not line up with the table's nine seats."""
+    if len(player_states) != 9:
+        raise ValueError("player_states must have exactly 9 entries")
+    for seat, state in zip(table.seats, player_states):
+        if seat is None and state is not None:
+            raise ValueError("player_states must be None for empty seats")
+        if seat is not None and (state is None or state.player.name != seat.name):
+            raise ValueError("player_states must match table seats")
+
+
 class GameStopReason(str, Enum):
     """Reasons that a game can terminate."""
 
@@ -52,13 +93,19 @@ class GameStopReason(str, Enum):
 
 @dataclass(slots=True, frozen=True)
 class GameConfig:
-    """Configuration for stopping conditions."""
+    """Configuration for stopping conditions.
+
+    Frozen so that ``Game`` can copy the limits into its stop check once, when
+    the game is built, instead of reading the config on every roll.
+    """
 
     target_points: Optional[int] = None
     max_rolls: Optional[int] = None
 
     def __post_init__(self) -> None:
-        """Validate configuration values."""
+        """Validate configuration values (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if self.target_points is not None and self.target_points <= 0:
             raise ValueError("target_points must be positive")
         if self.max_rolls is not None and self.max_rolls <= 0:
@@ -76,7 +123,9 @@ class PlayerState:
     max_bet: Optional[int] = None
 
     def __post_init__(self) -> None:
-        """Validate player state."""
+        """Validate player state (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if self.base_bet <= 0:
             raise ValueError("base_bet must be positive")
         if self.max_bet is not None and self.max_bet <= 0:
@@ -94,9 +143,12 @@ class PlayerState:
         return max_win is not None and self.player.bankroll.balance >= max_win
 
 
-@dataclass(slots=True, frozen=True)
-class GameStep:
-    """Result of a single game step."""
+class GameStep(NamedTuple):
+    """Result of a single game step.
+
+    A named tuple rather than a dataclass: one is built for every roll, and tuple
+    construction is cheaper than a dataclass ``__init__``.
+    """
 
     roll_result: RollResult
     shooter_index: int
@@ -113,24 +165,21 @@ class Game:
         player_states: Tuple[Optional[PlayerState], ...],
         config: Optional[GameConfig] = None,
         rng: Optional[random.Random] = None,
-        dice: Optional[Dice] = None,
+        dice: Optional[RollSource] = None,
         stats: Optional[StatsCollector] = None,
     ) -> None:
-        """Initialize a game with a table, player states, and configuration."""
-        if len(player_states) != 9:
-            raise ValueError("player_states must have exactly 9 entries")
-        for seat_index, seat in enumerate(table.seats):
-            state = player_states[seat_index]
-            if seat is None and state is not None:
-                raise ValueError("player_states must be None for empty seats")
-            if seat is not None and (state is None or state.player.name != seat.name):
-                raise ValueError("player_states must match table seats")
+        """Initialize a game with a table, player states, and configuration.
 
+        Seating is validated unless running under ``python -O``.
+        """
+        if __debug__:
+            _validate_seating(table, player_states)
         self._table = table
         self._player_states = player_states
         self._config = config or GameConfig()
         self._engine = CrapsEngine(rng=rng, dice=dice)
         self._stats = stats or NullStatsCollector()
+        self._check_stop = self._make_check_stop(self._config)
         self.roll_count = 0
         self.shooter_index = self._first_shooter_index()
 
@@ -142,20 +191,17 @@ class Game:
         players: Tuple[PlayerState, ...],
         config: Optional[GameConfig] = None,
         rng: Optional[random.Random] = None,
-        dice: Optional[Dice] = None,
+        dice: Optional[RollSource] = None,
         stats: Optional[StatsCollector] = None,
     ) -> Game:
         """Build a table by seating players in order."""
-        table = Table.empty()
-        player_states: list[Optional[PlayerState]] = [None] * 9
-        for seat_index, state in enumerate(players):
-            if seat_index >= 9:
-                raise ValueError("Cannot seat more than 9 players")
-            table = table.seat_player(seat_index, state.player)
-            player_states[seat_index] = state
+        if len(players) > 9:
+            raise ValueError("Cannot seat more than 9 players")
+        table = Table.from_seats([state.player for state in players])
+        player_states: Tuple[Optional[PlayerState], ...] = tuple(players) + (None,) * (9 - len(players))
         return cls(
             table=table,
-            player_states=tuple(player_states),
+            player_states=player_states,
             config=config,
             rng=rng,
             dice=dice,
@@ -164,28 +210,60 @@ class Game:
 
     def step(self) -> GameStep:
         """Advance the game by one roll."""
+        shooter_index = self.shooter_index
+        roll_result, stop_reason = self._advance()
+        self._stats.record_roll(roll_result, shooter_index, self.roll_count, self._table)
+        if stop_reason is not None:
+            self._stats.record_game_end(stop_reason, self.roll_count, self._engine.completed_points)
+        return GameStep(roll_result, self.shooter_index, self.roll_count, stop_reason)
+
+    def run(self, max_steps: Optional[int] = None, until_decision: bool = False) -> GameStep:
+        """Step until a stop condition is met or ``max_steps`` rolls have been taken.
+
+        With ``until_decision`` the run also ends on the first roll that wins or
+        loses on the pass line, which is the only time bets need settling.
+
+        Returns the last step taken. Use this for headless runs that do not need
+        to act between rolls; no per-roll ``GameStep`` is built along the way, and
+        rolls reach the stats collector in batches rather than one call each.
+        """
+        if max_steps is not None and max_steps <= 0:
+            raise ValueError("max_steps must be positive")
+        advance = self._advance
+        results: List[RollResult] = []
+        shooters: List[int] = []
+        append_result = results.append
+        append_shooter = shooters.append
+        remaining = max_steps
+        while True:
+            shooter_index = self.shooter_index
+            roll_result, stop_reason = advance()
+            append_result(roll_result)
+            append_shooter(shooter_index)
+            if stop_reason is not None:
+                break
+            if until_decision and roll_result.pass_line_outcome is not _PUSH:
+                break
+            if len(results) >= _STATS_BATCH_SIZE:
+                self._stats.record_roll_batch(results, shooters, self.roll_count, self._table)
+                results.clear()
+                shooters.clear()
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    break
+        self._stats.record_roll_batch(results, shooters, self.roll_count, self._table)
+        if stop_reason is not None:
+            self._stats.record_game_end(stop_reason, self.roll_count, self._engine.completed_points)
+        return GameStep(roll_result, self.shooter_index, self.roll_count, stop_reason)
+
+    def _advance(self) -> tuple[RollResult, Optional[GameStopReason]]:
+        """Roll once, rotate the shooter, and check stop conditions; callers record stats."""
         roll_result = self._engine.roll()
         self.roll_count += 1
-        self._stats.record_roll(
-            roll_result=roll_result,
-            shooter_index=self.shooter_index,
-            roll_count=self.roll_count,
-            table=self._table,
-        )
-
         if self._should_rotate_shooter(roll_result):
             self.shooter_index = self._next_shooter_index(self.shooter_index)
-
-        stop_reason = self.check_stop()
-        if stop_reason is not None:
-            self._stats.record_game_end(stop_reason, self.roll_count, self._engine.completed_points)
-
-        return GameStep(
-            roll_result=roll_result,
-            shooter_index=self.shooter_index,
-            roll_count=self.roll_count,
-            stop_reason=stop_reason,
-        )
+        return roll_result, self._check_stop()
 
     def update_player_state(self, seat_index: int, state: PlayerState) -> None:
         """Update the player state for a given seat."""
@@ -196,13 +274,22 @@ class Game:
             raise ValueError("Cannot update state for empty seat")
         if seat.name != state.player.name:
             raise ValueError("Updated state must match existing seat")
-        states = list(self._player_states)
+        states = list(self._states)
         states[seat_index] = state
-        self._player_states = tuple(states)
+        self._states = tuple(states)
+        self._sync_seat(seat_index, state)
 
     def player_states(self) -> Tuple[Optional[PlayerState], ...]:
         """Return current player states."""
-        return self._player_states
+        return self._states
+
+    def wagering_mask(self) -> int:
+        """Return a bit mask of seats that still have bankroll and have not hit max win.
+
+        Bit ``i`` is set when seat ``i`` may wager. The mask is maintained as player
+        states change, so reading it does not re-derive any limits.
+        """
+        return self._bankroll_mask & ~self._max_win_mask
 
     @property
     def phase(self) -> Phase:
@@ -215,76 +302,110 @@ class Game:
 
     def check_stop(self) -> Optional[GameStopReason]:
         """Return a stop reason if the game should end."""
-        if self._config.target_points is not None and self._engine.completed_points >= self._config.target_points:
-            return GameStopReason.TARGET_POINTS_REACHED
-        if self._config.max_rolls is not None and self.roll_count >= self._config.max_rolls:
-            return GameStopReason.MAX_ROLLS_REACHED
-        if not self._players_with_bankroll():
+        return self._check_stop()
+
+    def _make_check_stop(self, config: GameConfig) -> Callable[[], Optional[GameStopReason]]:
+        """Return a stop check specialized to the configured point and roll limits.
+
+        Each variant holds its limits as closure locals and omits the tests for
+        limits that are not set, so the per-roll check never consults the config.
+        """
+        check_seats = self._check_seats
+        engine = self._engine
+        target_points = config.target_points
+        max_rolls = config.max_rolls
+        if target_points is None and max_rolls is None:
+            return check_seats
+        if max_rolls is None:
+
+            def check_points() -> Optional[GameStopReason]:
+                if engine.completed_points >= target_points:
+                    return GameStopReason.TARGET_POINTS_REACHED
+                return check_seats()
+
+            return check_points
+        if target_points is None:
+
+            def check_rolls() -> Optional[GameStopReason]:
+                if self.roll_count >= max_rolls:
+                    return GameStopReason.MAX_ROLLS_REACHED
+                return check_seats()
+
+            return check_rolls
+
+        def check_points_and_rolls() -> Optional[GameStopReason]:
+            if engine.completed_points >= target_points:
+                return GameStopReason.TARGET_POINTS_REACHED
+            if self.roll_count >= max_rolls:
+                return GameStopReason.MAX_ROLLS_REACHED
+            return check_seats()
+
+        return check_points_and_rolls
+
+    def _check_seats(self) -> Optional[GameStopReason]:
+        """Return a stop reason derived from the per-seat masks, if any."""
+        bankroll_mask = self._bankroll_mask
+        if not bankroll_mask:
             return GameStopReason.NO_BANKROLL_REMAINING
-        if self._all_max_win_reached():
+        eligible_mask = bankroll_mask & ~self._max_win_mask
+        if not eligible_mask:
             return GameStopReason.ALL_MAX_WIN_REACHED
-        if self._only_non_shooter_left():
+        if eligible_mask.bit_count() == 1 and not eligible_mask & self._can_shoot_mask:
             return GameStopReason.ONLY_NON_SHOOTER_LEFT
         return None
 
-    def _eligible_players(self) -> Tuple[PlayerState, ...]:
-        """Return players who can keep wagering and have not hit max win."""
-        eligible: list[PlayerState] = []
-        for state in self._player_states:
-            if state is None:
-                continue
-            if state.has_bankroll() and not state.reached_max_win():
-                eligible.append(state)
-        return tuple(eligible)
-
-    def _players_with_bankroll(self) -> Tuple[PlayerState, ...]:
-        """Return players who still have money."""
-        remaining: list[PlayerState] = []
-        for state in self._player_states:
-            if state is None:
-                continue
-            if state.has_bankroll():
-                remaining.append(state)
-        return tuple(remaining)
-
-    def _all_max_win_reached(self) -> bool:
-        """Return True if all players with bankroll have reached max win targets."""
-        players_with_bankroll = self._players_with_bankroll()
-        if not players_with_bankroll:
-            return False
-        for state in players_with_bankroll:
-            if state.player.bankroll.max_win is None:
-                return False
-            if not state.reached_max_win():
-                return False
-        return True
-
-    def _only_non_shooter_left(self) -> bool:
-        """Return True if only one eligible player remains and they cannot shoot."""
-        eligible = self._eligible_players()
-        return len(eligible) == 1 and not eligible[0].can_shoot
+    @property
+    def _player_states(self) -> Tuple[Optional[PlayerState], ...]:
+        """Return the per-seat player states."""
+        return self._states
+
+    @_player_states.setter
+    def _player_states(self, states: Tuple[Optional[PlayerState], ...]) -> None:
+        """Replace all player states and rebuild the per-seat masks."""
+        self._states = states
+        self._bankroll_mask = 0
+        self._max_win_mask = 0
+        self._can_shoot_mask = 0
+        self._shooter_mask = 0
+        for seat_index, state in enumerate(states):
+            if state is not None:
+                self._sync_seat(seat_index, state)
+
+    def _sync_seat(self, seat_index: int, state: PlayerState) -> None:
+        """Update each per-seat bit mask from a player's state.
+
+        Bit ``i`` of each mask describes seat ``i``: has bankroll, reached max
+        win, may shoot, and may shoot while still eligible to wager.
+        """
+        bit = 1 << seat_index
+        keep = ~bit
+        has_bankroll = state.has_bankroll()
+        reached_max_win = state.reached_max_win()
+        self._bankroll_mask = self._bankroll_mask & keep | (bit if has_bankroll else 0)
+        self._max_win_mask = self._max_win_mask & keep | (bit if reached_max_win else 0)
+        self._can_shoot_mask = self._can_shoot_mask & keep | (bit if state.can_shoot else 0)
+        can_take_dice = state.can_shoot and has_bankroll and not reached_max_win
+        self._shooter_mask = self._shooter_mask & keep | (bit if can_take_dice else 0)
 
     def _first_shooter_index(self) -> int:
-        """Find the first eligible shooter."""
-        for seat_index, state in enumerate(self._player_states):
-            if state is not None and state.has_bankroll() and state.can_shoot and not state.reached_max_win():
-                return seat_index
-        raise ValueError("No eligible shooters available")
+        """Find the first eligible shooter from the lowest set bit of the shooter mask."""
+        mask = self._shooter_mask
+        if not mask:
+            raise ValueError("No eligible shooters available")
+        return (mask & -mask).bit_length() - 1
 
     def _next_shooter_index(self, current_index: int) -> int:
         """Rotate to the next eligible shooter."""
-        for offset in range(1, 10):
-            seat_index = (current_index + offset) % 9
-            state = self._player_states[seat_index]
-            if state is not None and state.has_bankroll() and state.can_shoot and not state.reached_max_win():
-                return seat_index
-        raise ValueError("No eligible shooters available for rotation")
+        seat_index = _NEXT_SHOOTER[self._shooter_mask * 9 + current_index]
+        if seat_index < 0:
+            raise ValueError("No eligible shooters available for rotation")
+        return seat_index
 
     @staticmethod
     def _should_rotate_shooter(roll_result: RollResult) -> bool:
-        """Rotate shooter on seven-out."""
-        return (
-            roll_result.phase_before == Phase.POINT_ON
-            and roll_result.roll.total == 7
-            and roll_result.pass_line_outcome == PassLineOutcome.LOSS
-        )
+        """Rotate shooter on seven-out.
+
+        A pass line loss while a point is on can only come from a seven, so the
+        phase and outcome identities are enough.
+        """
+        return roll_result.pass_line_outcome is _LOSS and roll_result.phase_before is _POINT_ON
@@ -0,0 +1,143 @@
+"""Integer-only headless game loop for the built-in betting strategies."""
+
+from __future__ import annotations
+
+import random
+from typing import List, Optional, Sequence, Tuple
+
+from p6_craps.dice import Dice, default_rng
+from p6_craps.engine import _TRANSITIONS
+from p6_craps.enums import PassLineOutcome
+from p6_craps.game import _NEXT_SHOOTER, GameConfig, PlayerState
+from p6_craps.strategy import FlatBetStrategy, MartingaleStrategy, ParoliStrategy
+
+_FLAT = 0
+_MARTINGALE = 1
+_PAROLI = 2
+_STRATEGY_CODES = {FlatBetStrategy: _FLAT, MartingaleStrategy: _MARTINGALE, ParoliStrategy: _PAROLI}
+
+_PUSH = 0
+_WIN = 1
+_LOSS = 2
+_OUTCOME_CODES = {PassLineOutcome.PUSH: _PUSH, PassLineOutcome.WIN: _WIN, PassLineOutcome.LOSS: _LOSS}
+
+# ``(point_after or 0, outcome code, completed)`` indexed by [point or 0][total].
+_KERNEL_TRANSITIONS: Tuple[Tuple[Optional[Tuple[int, int, int]], ...], ...] = tuple(
+    tuple(None if entry is None else (entry[1] or 0, _OUTCOME_CODES[entry[2]], entry[3]) for entry in row)
+    for row in _TRANSITIONS
+)
+
+
+def supports(players: Sequence[PlayerState]) -> bool:
+    """Return True if every player uses a built-in strategy the kernel can encode."""
+    return len(players) <= 9 and all(type(state.strategy) in _STRATEGY_CODES for state in players)
+
+
+def play(
+    players: Sequence[PlayerState],
+    game_config: GameConfig,
+    rng: Optional[random.Random] = None,
+) -> Tuple[int, int]:
+    """Play one headless betting game and return its roll count and points made.
+
+    This is the game ``Game`` and the simulate betting helpers play, encoded as
+    per-seat int lists: strategies become codes, bankroll limits become seat
+    bit masks, and no roll, state, or bet objects are built along the way. It
+    draws the same dice in the same order, so a seeded run matches the object
+    path exactly. Callers check ``supports`` first.
+    """
+    seats = len(players)
+    balance = [state.player.bankroll.balance for state in players]
+    max_win = [state.player.bankroll.max_win for state in players]
+    base_bet = [state.base_bet for state in players]
+    max_bet = [state.max_bet for state in players]
+    strategy = [_STRATEGY_CODES[type(state.strategy)] for state in players]
+    wins = [0] * seats
+    losses = [0] * seats
+    active_bet = [0] * seats
+    can_shoot_mask = sum(1 << seat for seat, state in enumerate(players) if state.can_shoot)
+
+    def wagering_mask() -> int:
+        mask = 0
+        for seat in range(seats):
+            limit = max_win[seat]
+            if balance[seat] > 0 and (limit is None or balance[seat] < limit):
+                mask |= 1 << seat
+        return mask
+
+    def bankroll_mask() -> int:
+        return sum(1 << seat for seat in range(seats) if balance[seat] > 0)
+
+    wagering = wagering_mask()
+    shooter_mask = wagering & can_shoot_mask
+    if not shooter_mask:
+        raise ValueError("No eligible shooters available")
+    shooter = (shooter_mask & -shooter_mask).bit_length() - 1
+    bettors: List[int] = [seat for seat in range(seats) if wagering >> seat & 1]
+    has_bankroll = bankroll_mask()
+
+    roll_total = Dice(rng=rng or default_rng()).roll_total
+    transitions = _KERNEL_TRANSITIONS
+    next_shooter = _NEXT_SHOOTER
+    target_points = game_config.target_points
+    max_rolls = game_config.max_rolls
+    point = 0
+    completed = 0
+    rolls = 0
+    while True:
+        if not point:
+            for seat in bettors:
+                if active_bet[seat] > 0 or not wagering >> seat & 1:
+                    continue
+                bankroll = balance[seat]
+                code = strategy[seat]
+                if code == _FLAT:
+                    active_bet[seat] = min(base_bet[seat], bankroll)
+                    continue
+                bet = base_bet[seat] << (losses[seat] if code == _MARTINGALE else wins[seat])
+                cap = max_bet[seat]
+                active_bet[seat] = min(bet, bet if cap is None else cap, bankroll)
+
+        stopped = False
+        while True:
+            point_before = point
+            point, outcome, made = transitions[point][roll_total()]
+            completed += made
+            rolls += 1
+            if outcome == _LOSS and point_before:
+                shooter = next_shooter[shooter_mask * 9 + shooter]
+                if shooter < 0:
+                    raise ValueError("No eligible shooters available for rotation")
+            if target_points is not None and completed >= target_points:
+                stopped = True
+            elif max_rolls is not None and rolls >= max_rolls:
+                stopped = True
+            elif not has_bankroll or not wagering:
+                stopped = True
+            elif wagering.bit_count() == 1 and not wagering & can_shoot_mask:
+                stopped = True
+            if stopped or outcome:
+                break
+
+        if outcome:
+            for seat in bettors:
+                amount = active_bet[seat]
+                if amount <= 0:
+                    continue
+                if outcome == _WIN:
+                    balance[seat] += amount
+                    wins[seat] += 1
+                    losses[seat] = 0
+                else:
+                    balance[seat] -= amount
+                    wins[seat] = 0
+                    losses[seat] += 1
+                active_bet[seat] = 0
+            updated = wagering_mask()
+            if updated != wagering:
+                wagering = updated
+                shooter_mask = wagering & can_shoot_mask
+                has_bankroll = bankroll_mask()
+                bettors = [seat for seat in bettors if wagering >> seat & 1]
+        if stopped:
+            return rolls, completed
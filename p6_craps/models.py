@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
 
 
 @dataclass(slots=True, frozen=True)
@@ -14,7 +14,9 @@ class Bankroll:
     max_win: Optional[int] = None
 
     def __post_init__(self) -> None:
-        """Validate bankroll configuration."""
+        """Validate bankroll configuration (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if self.balance < 0:
             raise ValueError(f"Bankroll balance cannot be negative, got {self.balance}")
         if self.max_win is not None and self.max_win <= 0:
@@ -25,7 +27,7 @@ class Bankroll:
         new_balance = self.balance + delta
         if new_balance < 0:
             raise ValueError("Bankroll cannot go negative")
-        return replace(self, balance=new_balance)
+        return Bankroll(balance=new_balance, max_win=self.max_win)
 
 
 @dataclass(slots=True, frozen=True)
@@ -36,7 +38,9 @@ class Player:
     bankroll: Bankroll
 
     def __post_init__(self) -> None:
-        """Validate player configuration."""
+        """Validate player configuration (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if not self.name.strip():
             raise ValueError("Player name cannot be empty")
 
@@ -48,7 +52,9 @@ class Table:
     seats: Tuple[Optional[Player], ...]
 
     def __post_init__(self) -> None:
-        """Validate seat configuration."""
+        """Validate seat configuration (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if len(self.seats) != 9:
             raise ValueError(f"Table must have exactly 9 seats, got {len(self.seats)}")
 
@@ -57,6 +63,13 @@ class Table:
         """Create an empty table with nine open seats."""
         return cls(seats=(None,) * 9)
 
+    @classmethod
+    def from_seats(cls, seats: Sequence[Optional[Player]]) -> Table:
+        """Create a table from up to nine seats in order, leaving the rest open."""
+        if len(seats) > 9:
+            raise ValueError(f"Table cannot have more than 9 seats, got {len(seats)}")
+        return cls(seats=tuple(seats) + (None,) * (9 - len(seats)))
+
     def seat_player(self, seat_index: int, player: Player) -> Table:
         """Return a new table with a player seated."""
         if not 0 <= seat_index < 9:
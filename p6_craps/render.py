@@ -2,50 +2,58 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Sequence
-
-from p6_craps.stats import StatsCounters, StatsSnapshot, percent
-
-
-@dataclass(slots=True, frozen=True)
-class TableRow:
-    """Single row of a rendered table."""
-
-    label: str
-    values: Sequence[str]
+import functools
+from operator import itemgetter
+from typing import Sequence, Tuple
+
+from p6_craps.stats import (
+    DIE_FACES,
+    POINT_NUMBERS,
+    TOTAL_NUMBERS,
+    StatsCounters,
+    StatsSnapshot,
+    percent,
+)
+
+_TOTAL_VALUES = itemgetter(*TOTAL_NUMBERS)
+_DIE_VALUES = itemgetter(*DIE_FACES)
+_POINT_VALUES = itemgetter(*POINT_NUMBERS)
+
+
+def _row_template(label: str, fields: str) -> str:
+    """Return a padded row format string with ``fields`` after the label."""
+    return f"{label:<10} {fields}\n"
+
+
+def _totals_template(keys: Tuple[int, ...]) -> str:
+    """Return a ``key={}`` format string for counts in the given key order."""
+    return " ".join(f"{key}={{}}" for key in keys)
+
+
+# One format string per section, filled by a single ``str.format`` call.
+_SECTION_TEMPLATE = "".join(
+    [
+        "[{}]\n",
+        _row_template("rolls", "{}"),
+        _row_template("wins", "{} ({})"),
+        _row_template("losses", "{} ({})"),
+        _row_template("pushes", "{} ({})"),
+        _row_template("totals", _totals_template(TOTAL_NUMBERS)),
+        _row_template("die 1", _totals_template(DIE_FACES)),
+        _row_template("die 2", _totals_template(DIE_FACES)),
+        _row_template("point est", _totals_template(POINT_NUMBERS)),
+        _row_template("point made", _totals_template(POINT_NUMBERS)),
+        "\n",
+    ]
+)
 
 
+@functools.lru_cache(maxsize=8192)
 def _format_percent(numerator: int, denominator: int) -> str:
     """Format a percentage string."""
     return f"{percent(numerator, denominator):6.2f}%"
 
 
-def _format_counts(counters: StatsCounters) -> list[TableRow]:
-    """Format roll/outcome counts into table rows."""
-    total_rolls = counters.rolls
-    return [
-        TableRow("rolls", [str(total_rolls)]),
-        TableRow(
-            "wins",
-            [f"{counters.outcomes.win} ({_format_percent(counters.outcomes.win, total_rolls)})"],
-        ),
-        TableRow(
-            "losses",
-            [f"{counters.outcomes.loss} ({_format_percent(counters.outcomes.loss, total_rolls)})"],
-        ),
-        TableRow(
-            "pushes",
-            [f"{counters.outcomes.push} ({_format_percent(counters.outcomes.push, total_rolls)})"],
-        ),
-        TableRow("totals", [_format_totals(counters.roll_counts.totals)]),
-        TableRow("die 1", [_format_totals(counters.roll_counts.die_one)]),
-        TableRow("die 2", [_format_totals(counters.roll_counts.die_two)]),
-        TableRow("point est", [_format_totals(counters.point_counts.established)]),
-        TableRow("point made", [_format_totals(counters.point_counts.made)]),
-    ]
-
-
 def render_stats(snapshot: StatsSnapshot) -> str:
     """Render a stats snapshot as a human-readable table string."""
     sections = [
@@ -53,40 +61,54 @@ def render_stats(snapshot: StatsSnapshot) -> str:
         ("come-out", snapshot.come_out),
         ("point-on", snapshot.point_on),
     ]
-    lines: list[str] = []
-    for title, counters in sections:
-        lines.append(f"[{title}]")
-        lines.extend(_render_rows(_format_counts(counters)))
-        lines.append("")
-
-    lines.extend(_render_scoped("shooter", snapshot.per_shooter))
-    lines.extend(_render_scoped("player", snapshot.per_player))
+    sections += [
+        (f"shooter {seat_index}", snapshot.per_shooter[seat_index]) for seat_index in sorted(snapshot.per_shooter)
+    ]
+    sections += [
+        (f"player {seat_index}", snapshot.per_player[seat_index]) for seat_index in sorted(snapshot.per_player)
+    ]
+    text = "".join([_format_section(title, counters) for title, counters in sections])
     if snapshot.end_reason is not None:
-        lines.append(f"end: {snapshot.end_reason.value}")
-        lines.append(f"rolls: {snapshot.roll_count}")
-        lines.append(f"points: {snapshot.points_made}")
-    return "\n".join(lines).rstrip()
-
-
-def _format_totals(values: dict[int, int]) -> str:
-    """Format counts as key=value pairs."""
-    return " ".join(f"{key}={values[key]}" for key in sorted(values))
-
-
-def _render_scoped(label: str, scoped: dict[int, StatsCounters]) -> list[str]:
-    """Render per-seat scoped stats sections."""
-    lines: list[str] = []
-    for seat_index in sorted(scoped):
-        lines.append(f"[{label} {seat_index}]")
-        lines.extend(_render_rows(_format_counts(scoped[seat_index])))
-        lines.append("")
-    return lines
-
-
-def _render_rows(rows: Iterable[TableRow]) -> list[str]:
-    """Render a list of rows using padded columns."""
-    rendered = []
-    for row in rows:
-        values = " | ".join(row.values)
-        rendered.append(f"{row.label:<10} {values}")
-    return rendered
+        text += (
+            f"end: {snapshot.end_reason.value}\n" f"rolls: {snapshot.roll_count}\n" f"points: {snapshot.points_made}\n"
+        )
+    return text.rstrip()
+
+
+def _format_section(title: str, counters: StatsCounters) -> str:
+    """Return a titled block of padded rows followed by a blank line."""
+    rolls = counters.rolls
+    outcomes = counters.outcomes
+    roll_counts = counters.roll_counts.to_dict()
+    point_counts = counters.point_counts.to_dict()
+    return _SECTION_TEMPLATE.format(
+        title,
+        rolls,
+        outcomes.win,
+        _format_percent(outcomes.win, rolls),
+        outcomes.loss,
+        _format_percent(outcomes.loss, rolls),
+        outcomes.push,
+        _format_percent(outcomes.push, rolls),
+        *_TOTAL_VALUES(roll_counts["totals"]),
+        *_DIE_VALUES(roll_counts["die_one"]),
+        *_DIE_VALUES(roll_counts["die_two"]),
+        *_POINT_VALUES(point_counts["established"]),
+        *_POINT_VALUES(point_counts["made"]),
+    )
+
+
+def render_run_summary(results: Sequence[tuple[int, int]]) -> str:
+    """Render roll and point totals across many independent games."""
+    runs = len(results)
+    total_rolls = sum(rolls for rolls, _ in results)
+    total_points = sum(points for _, points in results)
+    mean_rolls = total_rolls / runs if runs else 0.0
+    mean_points = total_points / runs if runs else 0.0
+    return "\n".join(
+        [
+            f"runs: {runs}",
+            f"rolls: {total_rolls} (mean {mean_rolls:.2f})",
+            f"points: {total_points} (mean {mean_points:.2f})",
+        ]
+    )
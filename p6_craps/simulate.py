@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import random
+import shutil
+import sys
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Sequence
+from typing import Any, Callable, List, Mapping, Optional, Sequence, TextIO, TypeVar
 
+from p6_craps import kernel
+from p6_craps.dice import RollSource
 from p6_craps.enums import PassLineOutcome, Phase
 from p6_craps.game import Game, GameConfig, PlayerState
 from p6_craps.models import Bankroll, Player
 from p6_craps.render import render_stats
-from p6_craps.stats import TableStatsCollector
+from p6_craps.stats import StatsSnapshot, TableStatsCollector
 from p6_craps.strategy import (
     BetDecision,
     BettingState,
@@ -20,6 +27,15 @@ from p6_craps.strategy import (
     ParoliStrategy,
 )
 
+_T = TypeVar("_T")
+# Module-level aliases let the per-roll betting helpers compare enum members by identity.
+_COME_OUT = Phase.COME_OUT
+_WIN = PassLineOutcome.WIN
+_PUSH = PassLineOutcome.PUSH
+_HOME_AND_ERASE = "\033[H\033[0J"
+_SPIN_THRESHOLD = 0.005
+_SPIN_MARGIN = 0.001
+
 
 @dataclass(slots=True, frozen=True)
 class SimulationConfig:
@@ -27,55 +43,153 @@ class SimulationConfig:
 
     frame_delay: float = 0.0
     clear: bool = True
+    render_every: int = 1
 
     def __post_init__(self) -> None:
         """Validate simulation configuration."""
         if self.frame_delay < 0:
             raise ValueError("frame_delay must be non-negative")
+        if self.render_every < 0:
+            raise ValueError("render_every must be non-negative")
+
+    def should_render(self, roll_count: int, final: bool) -> bool:
+        """Return True if the frame after ``roll_count`` rolls should be drawn.
+
+        A ``render_every`` of 0 draws only the final frame.
+        """
+        if final:
+            return True
+        return self.render_every > 0 and roll_count % self.render_every == 0
 
 
 @dataclass(slots=True)
 class BettingTracker:
-    """Track an active bet and strategy state."""
-
-    state: BettingState
+    """Track an active bet and strategy state for one seat.
+
+    The seat's strategy and bet limits are captured when the tracker is built,
+    and the strategy counters are plain fields updated in place as bets settle; a
+    frozen ``BettingState`` is only built when a strategy is asked for its next
+    bet. ``flat_bet`` marks a plain ``FlatBetStrategy`` player, whose next bet is
+    just the base bet capped by bankroll and needs no strategy call.
+    """
+
+    seat_index: int
+    strategy: BettingStrategy
+    bankroll: int
+    base_bet: int
+    max_bet: Optional[int] = None
+    consecutive_wins: int = 0
+    consecutive_losses: int = 0
+    last_outcome: Optional[PassLineOutcome] = None
     active_bet: int = 0
+    flat_bet: bool = False
+
+    def betting_state(self) -> BettingState:
+        """Return the strategy view of this seat's current state."""
+        return BettingState(
+            self.bankroll,
+            self.base_bet,
+            self.max_bet,
+            self.consecutive_wins,
+            self.consecutive_losses,
+            self.last_outcome,
+        )
+
+    def settle(self, bankroll: int, outcome: PassLineOutcome) -> None:
+        """Record a resolved bet's outcome and the seat's new bankroll."""
+        if outcome is _WIN:
+            self.consecutive_wins += 1
+            self.consecutive_losses = 0
+        else:
+            self.consecutive_wins = 0
+            self.consecutive_losses += 1
+        self.bankroll = bankroll
+        self.last_outcome = outcome
+        self.active_bet = 0
 
 
 def run_simulation(
     players: Sequence[PlayerState],
     game_config: GameConfig,
     sim_config: SimulationConfig,
+    dice: Optional[RollSource] = None,
 ) -> int:
-    """Run a simulation until stop conditions are met."""
+    """Run a simulation until stop conditions are met, drawing rolls from ``dice`` if given."""
     stats = TableStatsCollector()
-    game = Game.from_players(players=tuple(players), config=game_config, stats=stats)
+    game = Game.from_players(players=tuple(players), config=game_config, dice=dice, stats=stats)
     trackers = _init_trackers(game.player_states())
+    # Bind per-roll callables and settings to locals once; the loop runs every roll.
+    place_bets, settle_bets, render_frame, pause_until = _place_bets, _settle_bets, _render_frame, _pause_until
+    step_game = game.step
+    should_render = sim_config.should_render
+    frame_delay = sim_config.frame_delay
+    stream = sys.stdout
+    interactive = stream.isatty()
+    prefix = _HOME_AND_ERASE if sim_config.clear and interactive else ""
+    # Frames drawn in place on a terminal are diffed against the last one drawn.
+    previous: Optional[List[str]] = [] if prefix else None
+    deadline = time.perf_counter()
     while True:
-        _place_bets(game, trackers)
-        step = game.step()
-        _settle_bets(game, trackers, step.roll_result.pass_line_outcome)
-        _render_frame(stats, clear=sim_config.clear)
-        if step.stop_reason is not None:
+        place_bets(game, trackers)
+        step = step_game()
+        settle_bets(game, trackers, step.roll_result.pass_line_outcome)
+        final = step.stop_reason is not None
+        if not should_render(step.roll_count, final=final):
+            continue
+        render_frame(stats, stream, prefix, interactive, previous)
+        if final:
             return 0
-        if sim_config.frame_delay:
-            time.sleep(sim_config.frame_delay)
+        if frame_delay:
+            deadline = pause_until(deadline + frame_delay)
 
 
 def run_until_complete(
     players: Sequence[PlayerState],
     game_config: GameConfig,
+    rng: Optional[random.Random] = None,
+    dice: Optional[RollSource] = None,
 ) -> tuple[int, int]:
-    """Run a simulation without rendering; return roll count and points made."""
-    stats = TableStatsCollector()
-    game = Game.from_players(players=tuple(players), config=game_config, stats=stats)
-    trackers = _init_trackers(game.player_states())
-    while True:
-        _place_bets(game, trackers)
-        step = game.step()
-        _settle_bets(game, trackers, step.roll_result.pass_line_outcome)
-        if step.stop_reason is not None:
-            return game.snapshot()
+    """Run a simulation without rendering; return roll count and points made.
+
+    Tables that only use the built-in strategies run on the integer kernel,
+    which plays the same game without building per-roll objects or stats.
+    A ``dice`` source, such as a ``ReplayDice`` stream, is played on the object
+    path instead, since the kernel draws from its own dice.
+    """
+    if dice is None and kernel.supports(players):
+        return kernel.play(players, game_config, rng)
+    game, _ = _play_headless(players, game_config, rng, dice)
+    return game.snapshot()
+
+
+def run_many(
+    players: Sequence[PlayerState],
+    game_config: GameConfig,
+    seeds: Sequence[int],
+    jobs: Optional[int] = 1,
+) -> list[tuple[int, int]]:
+    """Run one headless game per seed, fanning out across ``jobs`` processes.
+
+    Games are independent, so results are returned in seed order regardless of
+    which worker ran them. A ``jobs`` of None uses one process per CPU.
+    """
+    return [result for chunk in _map_seeded(_run_seeded, players, game_config, seeds, jobs) for result in chunk]
+
+
+def run_many_stats(
+    players: Sequence[PlayerState],
+    game_config: GameConfig,
+    seeds: Sequence[int],
+    jobs: Optional[int] = 1,
+) -> StatsSnapshot:
+    """Run one headless game per seed and merge every game's stats into one snapshot.
+
+    Each worker merges its own games first and returns a single snapshot.
+    """
+    merged = StatsSnapshot.empty()
+    for snapshot in _map_seeded(_run_seeded_stats, players, game_config, seeds, jobs):
+        merged.merge(snapshot)
+    return merged
 
 
 def default_players() -> tuple[PlayerState, ...]:
@@ -140,37 +254,194 @@ def simulation_config_from_config(
     config: Mapping[str, Any],
     frame_delay: float,
     clear: bool,
+    render_every: int | None = None,
+    interactive: bool = True,
 ) -> SimulationConfig:
-    """Build simulation config with CLI overrides."""
+    """Build simulation config with CLI overrides.
+
+    When neither the CLI nor the config sets ``render_every``, output that is
+    not ``interactive`` and has no frame delay draws only the final frame.
+    """
     resolved_delay = frame_delay
     if "frame_delay" in config and frame_delay == 0.0:
         resolved_delay = float(config.get("frame_delay") or 0.0)
     resolved_clear = clear
     if "clear" in config:
         resolved_clear = bool(config.get("clear"))
-    return SimulationConfig(frame_delay=resolved_delay, clear=resolved_clear)
+    resolved_render_every = render_every
+    if resolved_render_every is None and "render_every" in config:
+        resolved_render_every = _require_int(config.get("render_every"), "render_every", minimum=0)
+    if resolved_render_every is None:
+        resolved_render_every = 0 if not interactive and resolved_delay == 0.0 else 1
+    return SimulationConfig(
+        frame_delay=resolved_delay,
+        clear=resolved_clear,
+        render_every=resolved_render_every,
+    )
+
 
+def _render_frame(
+    stats: TableStatsCollector,
+    stream: TextIO,
+    prefix: str,
+    flush: bool,
+    previous: Optional[List[str]] = None,
+) -> None:
+    """Render a single stats frame to ``stream`` with one write.
+
+    The caller works out once per run whether the stream is a terminal. On a
+    terminal, ``prefix`` homes the cursor and erases below it, and each frame
+    is flushed so it shows immediately. Piped output is left to the stream's
+    own buffering.
+
+    ``previous`` holds the lines of the last frame drawn in place. Once it is
+    filled, only lines that changed are rewritten, each at its own row, and
+    anything below the new frame is erased; the list is updated to the new frame.
+    Row positions only match the frame while it fits on screen, so a frame as
+    tall as the terminal is drawn in full and the next frame is drawn in full too.
+    """
+    frame = render_stats(stats.snapshot())
+    if previous is None:
+        stream.write(f"{prefix}{frame}\n")
+    else:
+        lines = frame.split("\n")
+        if len(lines) >= shutil.get_terminal_size().lines:
+            stream.write(f"{prefix}{frame}\n")
+            previous.clear()
+        elif previous:
+            drawn = len(previous)
+            parts = [
+                f"\033[{row};1H{line}\033[K"
+                for row, line in enumerate(lines, 1)
+                if row > drawn or line != previous[row - 1]
+            ]
+            parts.append(f"\033[{len(lines) + 1};1H\033[0J")
+            stream.write("".join(parts))
+            previous[:] = lines
+        else:
+            stream.write(f"{prefix}{frame}\n")
+            previous[:] = lines
+    if flush:
+        stream.flush()
+
+
+_SeededTask = tuple[tuple[PlayerState, ...], GameConfig, tuple[int, ...]]
+
+
+def _play_headless(
+    players: Sequence[PlayerState],
+    game_config: GameConfig,
+    rng: Optional[random.Random],
+    dice: Optional[RollSource] = None,
+) -> tuple[Game, TableStatsCollector]:
+    """Play a game with betting but no rendering; return the finished game and its stats.
+
+    Bets are only placed on a come-out roll with no bet working and only change on
+    a pass line decision, so the game runs straight from one decision to the next.
+    """
+    stats = TableStatsCollector()
+    game = Game.from_players(players=tuple(players), config=game_config, rng=rng, dice=dice, stats=stats)
+    trackers = _init_trackers(game.player_states())
+    place_bets, settle_bets = _place_bets, _settle_bets
+    run_game = game.run
+    while True:
+        place_bets(game, trackers)
+        step = run_game(until_decision=True)
+        settle_bets(game, trackers, step.roll_result.pass_line_outcome)
+        if step.stop_reason is not None:
+            return game, stats
 
-def _render_frame(stats: TableStatsCollector, clear: bool) -> None:
-    """Render a single stats frame to stdout."""
-    if clear:
-        print("\033[2J\033[H", end="")
-    snapshot = stats.snapshot()
-    print(render_stats(snapshot))
+
+def _map_seeded(
+    worker: Callable[[_SeededTask], _T],
+    players: Sequence[PlayerState],
+    game_config: GameConfig,
+    seeds: Sequence[int],
+    jobs: Optional[int],
+) -> list[_T]:
+    """Apply ``worker`` to contiguous chunks of seeds, serially or across a process pool.
+
+    Each task carries a block of seeds, so the players and config are pickled
+    once per chunk rather than once per game, and results come back in order.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs <= 0:
+        raise ValueError("jobs must be positive")
+    table = tuple(players)
+    seed_list = tuple(seeds)
+    if jobs == 1 or len(seed_list) <= 1:
+        return [worker((table, game_config, seed_list))]
+    size = max(1, -(-len(seed_list) // (jobs * 4)))
+    tasks = [(table, game_config, seed_list[start : start + size]) for start in range(0, len(seed_list), size)]
+    # Deferred: the process pool pulls in multiprocessing, which single-game runs never need.
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(worker, tasks))
+
+
+def _run_seeded(task: _SeededTask) -> list[tuple[int, int]]:
+    """Run one seeded headless game per seed in a chunk; a module-level target for worker processes."""
+    players, game_config, seeds = task
+    return [run_until_complete(players, game_config, rng=random.Random(seed)) for seed in seeds]
+
+
+def _run_seeded_stats(task: _SeededTask) -> StatsSnapshot:
+    """Run one seeded headless game per seed in a chunk and return their merged stats."""
+    players, game_config, seeds = task
+    merged = StatsSnapshot.empty()
+    for seed in seeds:
+        _, stats = _play_headless(players, game_config, random.Random(seed))
+        merged.merge(stats.snapshot())
+    return merged
+
+
+def _pause_until(deadline: float) -> float:
+    """Wait until ``deadline`` on the ``perf_counter`` clock and return the new schedule base.
+
+    The wait sleeps through long gaps and spins for the final stretch to avoid
+    sleep overshoot. Returning the deadline lets callers pace frames from a
+    fixed schedule so per-frame work does not add drift; a caller that is
+    already late gets the current time back instead, so it does not burst to
+    catch up.
+    """
+    now = time.perf_counter()
+    slack = deadline - now
+    if slack <= 0:
+        return now
+    if slack > _SPIN_THRESHOLD:
+        time.sleep(slack - _SPIN_MARGIN)
+    while time.perf_counter() < deadline:
+        pass
+    return deadline
 
 
 def _strategy_from_name(name: Any) -> BettingStrategy:
     """Resolve a strategy name to a strategy instance."""
     if name is None:
-        return FlatBetStrategy()
-    value = str(name).strip().lower()
+        return _strategy_instance("flat")
+    strategy = _strategy_instance(str(name).strip().lower())
+    if strategy is None:
+        raise ValueError(f"Unknown strategy {name!r}")
+    return strategy
+
+
+@functools.lru_cache(maxsize=32)
+def _strategy_instance(value: str) -> Optional[BettingStrategy]:
+    """Return the shared strategy for a normalized name.
+
+    The built-in strategies are frozen and hold no per-player state, so every
+    player that names one can use the same instance.
+    """
     if value in {"flat", "flat_bet", "flatbet"}:
         return FlatBetStrategy()
     if value in {"martingale"}:
         return MartingaleStrategy()
     if value in {"paroli"}:
         return ParoliStrategy()
-    raise ValueError(f"Unknown strategy {name!r}")
+    return None
 
 
 def _require_int(value: Any, label: str, minimum: int) -> int:
@@ -184,53 +455,61 @@ def _require_int(value: Any, label: str, minimum: int) -> int:
     return parsed
 
 
-def _init_trackers(players: Sequence[PlayerState | None]) -> Dict[int, BettingTracker]:
-    """Initialize betting trackers for each seat."""
-    trackers: Dict[int, BettingTracker] = {}
+def _init_trackers(players: Sequence[PlayerState | None]) -> List[BettingTracker]:
+    """Initialize betting trackers for the occupied seats that can still wager.
+
+    The list is the set of active bettors: trackers are updated in place, and
+    ``_settle_bets`` drops a seat once it busts or reaches max win, so the
+    betting loops only visit players who can still bet.
+    """
+    trackers: List[BettingTracker] = []
     for seat_index, state in enumerate(players):
-        if state is None:
+        if state is None or not state.has_bankroll() or state.reached_max_win():
             continue
-        trackers[seat_index] = BettingTracker(
-            state=BettingState(
+        trackers.append(
+            BettingTracker(
+                seat_index=seat_index,
+                strategy=state.strategy,
                 bankroll=state.player.bankroll.balance,
                 base_bet=state.base_bet,
                 max_bet=state.max_bet,
-            ),
+                flat_bet=type(state.strategy) is FlatBetStrategy,
+            )
         )
     return trackers
 
 
-def _place_bets(game: Game, trackers: Dict[int, BettingTracker]) -> None:
+def _place_bets(game: Game, trackers: Sequence[BettingTracker]) -> None:
     """Place bets for a new come-out roll."""
-    if game.phase != Phase.COME_OUT:
+    if game.phase is not _COME_OUT:
         return
-    for seat_index, state in enumerate(game.player_states()):
-        if state is None:
-            continue
-        tracker = trackers.get(seat_index)
-        if tracker is None:
-            continue
-        if tracker.active_bet > 0:
+    wagering_mask = game.wagering_mask()
+    for tracker in trackers:
+        if tracker.active_bet > 0 or not wagering_mask >> tracker.seat_index & 1:
             continue
-        if not state.has_bankroll() or state.reached_max_win():
+        if tracker.flat_bet:
+            tracker.active_bet = min(tracker.base_bet, tracker.bankroll)
             continue
-        decision = state.strategy.next_bet(tracker.state)
-        amount = _cap_bet(decision, tracker.state.bankroll)
-        tracker.active_bet = amount
+        decision = tracker.strategy.next_bet(tracker.betting_state())
+        tracker.active_bet = _cap_bet(decision, tracker.bankroll)
 
 
-def _settle_bets(game: Game, trackers: Dict[int, BettingTracker], outcome: PassLineOutcome) -> None:
-    """Settle active bets when a pass line outcome resolves."""
-    if outcome == PassLineOutcome.PUSH:
+def _settle_bets(game: Game, trackers: List[BettingTracker], outcome: PassLineOutcome) -> None:
+    """Settle active bets when a pass line outcome resolves, dropping seats that can no longer wager."""
+    if outcome is _PUSH:
         return
-    for seat_index, state in enumerate(game.player_states()):
-        if state is None:
+    states = game.player_states()
+    wagering_before = game.wagering_mask()
+    update_player_state = game.update_player_state
+    sign = 1 if outcome is _WIN else -1
+    for tracker in trackers:
+        if tracker.active_bet <= 0:
             continue
-        tracker = trackers.get(seat_index)
-        if tracker is None or tracker.active_bet <= 0:
+        seat_index = tracker.seat_index
+        state = states[seat_index]
+        if state is None:
             continue
-        delta = tracker.active_bet if outcome == PassLineOutcome.WIN else -tracker.active_bet
-        updated_bankroll = state.player.bankroll.apply(delta)
+        updated_bankroll = state.player.bankroll.apply(sign * tracker.active_bet)
         updated_player = Player(name=state.player.name, bankroll=updated_bankroll)
         updated_state = PlayerState(
             player=updated_player,
@@ -239,9 +518,11 @@ def _settle_bets(game: Game, trackers: Dict[int, BettingTracker], outcome: PassL
             base_bet=state.base_bet,
             max_bet=state.max_bet,
         )
-        game.update_player_state(seat_index, updated_state)
-        tracker.state = _update_betting_state(tracker.state, updated_bankroll.balance, outcome)
-        tracker.active_bet = 0
+        update_player_state(seat_index, updated_state)
+        tracker.settle(updated_bankroll.balance, outcome)
+    wagering_mask = game.wagering_mask()
+    if wagering_mask != wagering_before:
+        trackers[:] = [tracker for tracker in trackers if wagering_mask >> tracker.seat_index & 1]
 
 
 def _cap_bet(decision: BetDecision, bankroll: int) -> int:
@@ -249,25 +530,3 @@ def _cap_bet(decision: BetDecision, bankroll: int) -> int:
     if decision.amount <= 0 or bankroll <= 0:
         return 0
     return min(decision.amount, bankroll)
-
-
-def _update_betting_state(
-    state: BettingState,
-    bankroll: int,
-    outcome: PassLineOutcome,
-) -> BettingState:
-    """Update betting state after an outcome resolves."""
-    if outcome == PassLineOutcome.WIN:
-        wins = state.consecutive_wins + 1
-        losses = 0
-    else:
-        wins = 0
-        losses = state.consecutive_losses + 1
-    return BettingState(
-        bankroll=bankroll,
-        base_bet=state.base_bet,
-        max_bet=state.max_bet,
-        consecutive_wins=wins,
-        consecutive_losses=losses,
-        last_outcome=outcome,
-    )
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from p6_craps.dice import Roll
 from p6_craps.engine import RollResult
@@ -12,6 +13,13 @@ from p6_craps.game import GameStopReason, StatsCollector
 from p6_craps.models import Table
 
 POINT_NUMBERS = (4, 5, 6, 8, 9, 10)
+TOTAL_NUMBERS = tuple(range(2, 13))
+DIE_FACES = tuple(range(1, 7))
+_POINT_SET = frozenset(POINT_NUMBERS)
+_COME_OUT = Phase.COME_OUT
+_WIN = PassLineOutcome.WIN
+_LOSS = PassLineOutcome.LOSS
+_PUSH = PassLineOutcome.PUSH
 
 
 def percent(numerator: int, denominator: int) -> float:
@@ -21,6 +29,11 @@ def percent(numerator: int, denominator: int) -> float:
     return (numerator / denominator) * 100.0
 
 
+def _merge_counts(target: List[int], source: List[int]) -> None:
+    """Add per-slot counts from ``source`` into ``target`` in place."""
+    target[:] = [mine + theirs for mine, theirs in zip(target, source)]
+
+
 @dataclass(slots=True)
 class OutcomeCounts:
     """Counts for pass line outcomes."""
@@ -31,13 +44,19 @@ class OutcomeCounts:
 
     def record(self, outcome: PassLineOutcome) -> None:
         """Record a pass line outcome."""
-        if outcome == PassLineOutcome.WIN:
+        if outcome is _WIN:
             self.win += 1
-        elif outcome == PassLineOutcome.LOSS:
+        elif outcome is _LOSS:
             self.loss += 1
         else:
             self.push += 1
 
+    def merge(self, other: OutcomeCounts) -> None:
+        """Add another set of outcome counts into this one."""
+        self.win += other.win
+        self.loss += other.loss
+        self.push += other.push
+
     def as_percentages(self, total: int) -> Dict[str, float]:
         """Return outcome percentages."""
         return {
@@ -49,11 +68,15 @@ class OutcomeCounts:
 
 @dataclass(slots=True)
 class RollCounts:
-    """Counts for roll totals and individual dice."""
+    """Counts for roll totals and individual dice.
 
-    totals: Dict[int, int] = field(default_factory=lambda: {total: 0 for total in range(2, 13)})
-    die_one: Dict[int, int] = field(default_factory=lambda: {pip: 0 for pip in range(1, 7)})
-    die_two: Dict[int, int] = field(default_factory=lambda: {pip: 0 for pip in range(1, 7)})
+    Each field is a fixed-size list indexed by the value it counts, so
+    ``totals[7]`` is the number of sevens; slots below the smallest value stay 0.
+    """
+
+    totals: List[int] = field(default_factory=lambda: [0] * 13)
+    die_one: List[int] = field(default_factory=lambda: [0] * 7)
+    die_two: List[int] = field(default_factory=lambda: [0] * 7)
 
     def record(self, roll: Roll) -> None:
         """Record a roll total and pip counts."""
@@ -61,24 +84,50 @@ class RollCounts:
         self.die_one[roll.d1] += 1
         self.die_two[roll.d2] += 1
 
+    def merge(self, other: RollCounts) -> None:
+        """Add another set of roll counts into this one."""
+        _merge_counts(self.totals, other.totals)
+        _merge_counts(self.die_one, other.die_one)
+        _merge_counts(self.die_two, other.die_two)
+
+    def to_dict(self) -> Dict[str, Dict[int, int]]:
+        """Return the counts as ``{field: {value: count}}`` for valid totals and faces only."""
+        return {
+            "totals": {total: self.totals[total] for total in TOTAL_NUMBERS},
+            "die_one": {face: self.die_one[face] for face in DIE_FACES},
+            "die_two": {face: self.die_two[face] for face in DIE_FACES},
+        }
+
 
 @dataclass(slots=True)
 class PointCounts:
-    """Counts for points established and made."""
+    """Counts for points established and made, as lists indexed by point number."""
 
-    established: Dict[int, int] = field(default_factory=lambda: {point: 0 for point in POINT_NUMBERS})
-    made: Dict[int, int] = field(default_factory=lambda: {point: 0 for point in POINT_NUMBERS})
+    established: List[int] = field(default_factory=lambda: [0] * 11)
+    made: List[int] = field(default_factory=lambda: [0] * 11)
 
     def record_established(self, point: int) -> None:
         """Record a point being established."""
-        if point in self.established:
+        if point in _POINT_SET:
             self.established[point] += 1
 
     def record_made(self, point: int) -> None:
         """Record a point being made."""
-        if point in self.made:
+        if point in _POINT_SET:
             self.made[point] += 1
 
+    def merge(self, other: PointCounts) -> None:
+        """Add another set of point counts into this one."""
+        _merge_counts(self.established, other.established)
+        _merge_counts(self.made, other.made)
+
+    def to_dict(self) -> Dict[str, Dict[int, int]]:
+        """Return the counts as ``{field: {point: count}}`` for point numbers only."""
+        return {
+            "established": {point: self.established[point] for point in POINT_NUMBERS},
+            "made": {point: self.made[point] for point in POINT_NUMBERS},
+        }
+
 
 @dataclass(slots=True)
 class StatsCounters:
@@ -91,17 +140,29 @@ class StatsCounters:
 
     def record(self, roll_result: RollResult) -> None:
         """Record a roll result into the counters."""
+        outcome = roll_result.pass_line_outcome
         self.rolls += 1
-        self.outcomes.record(roll_result.pass_line_outcome)
         self.roll_counts.record(roll_result.roll)
-
-        if roll_result.phase_before == Phase.COME_OUT and roll_result.pass_line_outcome == PassLineOutcome.PUSH:
-            if roll_result.point_after is not None:
+        # One outcome test per roll decides both the outcome counter and the point
+        # counter; pushes come first because most rolls resolve nothing.
+        outcomes = self.outcomes
+        if outcome is _PUSH:
+            outcomes.push += 1
+            if roll_result.phase_before is _COME_OUT and roll_result.point_after is not None:
                 self.point_counts.record_established(roll_result.point_after)
-
-        if roll_result.phase_before == Phase.POINT_ON and roll_result.pass_line_outcome == PassLineOutcome.WIN:
-            if roll_result.point_before is not None:
+        elif outcome is _WIN:
+            outcomes.win += 1
+            if roll_result.phase_before is not _COME_OUT and roll_result.point_before is not None:
                 self.point_counts.record_made(roll_result.point_before)
+        else:
+            outcomes.loss += 1
+
+    def merge(self, other: StatsCounters) -> None:
+        """Add another set of counters into this one."""
+        self.rolls += other.rolls
+        self.outcomes.merge(other.outcomes)
+        self.roll_counts.merge(other.roll_counts)
+        self.point_counts.merge(other.point_counts)
 
 
 @dataclass(slots=True)
@@ -111,18 +172,88 @@ class StatsSnapshot:
     overall: StatsCounters
     come_out: StatsCounters
     point_on: StatsCounters
-    per_shooter: Dict[int, StatsCounters]
-    per_player: Dict[int, StatsCounters]
+    per_shooter: Mapping[int, StatsCounters]
+    per_player: Mapping[int, StatsCounters]
     end_reason: Optional[GameStopReason] = None
     roll_count: int = 0
     points_made: int = 0
 
+    @classmethod
+    def empty(cls) -> StatsSnapshot:
+        """Return a snapshot with no recorded rolls, ready to merge into."""
+        return cls(
+            overall=StatsCounters(),
+            come_out=StatsCounters(),
+            point_on=StatsCounters(),
+            per_shooter={},
+            per_player={},
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle per-seat views as plain dicts, since mapping proxies cannot be pickled."""
+        return (
+            type(self),
+            (
+                self.overall,
+                self.come_out,
+                self.point_on,
+                dict(self.per_shooter),
+                dict(self.per_player),
+                self.end_reason,
+                self.roll_count,
+                self.points_made,
+            ),
+        )
+
+    def merge(self, other: StatsSnapshot) -> None:
+        """Add another game's stats into this snapshot.
+
+        Counters and totals are summed per scope and seat. Summed counters are
+        new objects, so counters shared with a collector's live snapshot are never
+        changed. A merged snapshot spans several games, so it carries no single
+        end reason.
+        """
+        self.overall = _summed(self.overall, other.overall)
+        self.come_out = _summed(self.come_out, other.come_out)
+        self.point_on = _summed(self.point_on, other.point_on)
+        self.per_shooter = _merge_scopes(self.per_shooter, other.per_shooter)
+        self.per_player = _merge_scopes(self.per_player, other.per_player)
+        self.end_reason = None
+        self.roll_count += other.roll_count
+        self.points_made += other.points_made
+
+
+def _summed(*counters: StatsCounters) -> StatsCounters:
+    """Return new counters holding the sum of ``counters``."""
+    total = StatsCounters()
+    for item in counters:
+        total.merge(item)
+    return total
+
+
+def _merge_scopes(
+    target: Mapping[int, StatsCounters], incoming: Mapping[int, StatsCounters]
+) -> Dict[int, StatsCounters]:
+    """Return a new per-seat mapping with ``incoming`` summed into ``target``."""
+    merged = dict(target)
+    for seat_index, counters in incoming.items():
+        existing = merged.get(seat_index)
+        merged[seat_index] = _summed(counters) if existing is None else _summed(existing, counters)
+    return merged
+
 
 class TableStatsCollector(StatsCollector):
-    """Collect stats by phase and shooter for a game table."""
+    """Collect stats by phase and shooter for a game table.
+
+    Rolls are buffered and folded into the counters in batches, either when the
+    buffer fills or when a snapshot is taken. Per-player counters receive one
+    merged batch rather than one update per seat per roll.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, flush_size: int = 4096) -> None:
         """Initialize stats containers."""
+        if flush_size <= 0:
+            raise ValueError("flush_size must be positive")
         self._overall = StatsCounters()
         self._come_out = StatsCounters()
         self._point_on = StatsCounters()
@@ -131,6 +262,10 @@ class TableStatsCollector(StatsCollector):
         self._end_reason: Optional[GameStopReason] = None
         self._roll_count = 0
         self._points_made = 0
+        self._flush_size = flush_size
+        self._pending_results: List[RollResult] = []
+        self._pending_shooters: List[int] = []
+        self._pending_table: Optional[Table] = None
 
     def record_game_start(self, table: Table) -> None:
         """Initialize per-seat stats."""
@@ -141,28 +276,36 @@ class TableStatsCollector(StatsCollector):
             self._per_shooter[seat_index] = StatsCounters()
 
     def record_roll(self, roll_result: RollResult, shooter_index: int, roll_count: int, table: Table) -> None:
-        """Record a single roll and update per-scope stats."""
+        """Buffer a single roll for the next batch update."""
         if table.seats[shooter_index] is None:
             raise ValueError("Shooter seat is empty")
 
+        if table is not self._pending_table:
+            self._flush()
+            self._pending_table = table
         self._roll_count = roll_count
-        self._overall.record(roll_result)
-
-        if roll_result.phase_before == Phase.COME_OUT:
-            self._come_out.record(roll_result)
-        else:
-            self._point_on.record(roll_result)
-
-        if shooter_index not in self._per_shooter:
-            self._per_shooter[shooter_index] = StatsCounters()
-        self._per_shooter[shooter_index].record(roll_result)
-
-        for seat_index, seat in enumerate(table.seats):
-            if seat is None:
-                continue
-            if seat_index not in self._per_player:
-                self._per_player[seat_index] = StatsCounters()
-            self._per_player[seat_index].record(roll_result)
+        self._pending_results.append(roll_result)
+        self._pending_shooters.append(shooter_index)
+        if len(self._pending_results) >= self._flush_size:
+            self._flush()
+
+    def record_roll_batch(
+        self, results: Sequence[RollResult], shooters: Sequence[int], roll_count: int, table: Table
+    ) -> None:
+        """Buffer parallel columns of roll results and shooter seats from ``Game.run``."""
+        seats = table.seats
+        for shooter_index in set(shooters):
+            if seats[shooter_index] is None:
+                raise ValueError("Shooter seat is empty")
+
+        if table is not self._pending_table:
+            self._flush()
+            self._pending_table = table
+        self._roll_count = roll_count
+        self._pending_results.extend(results)
+        self._pending_shooters.extend(shooters)
+        if len(self._pending_results) >= self._flush_size:
+            self._flush()
 
     def record_game_end(self, reason: GameStopReason, roll_count: int, points_made: int) -> None:
         """Record the game end reason and totals."""
@@ -171,14 +314,69 @@ class TableStatsCollector(StatsCollector):
         self._points_made = points_made
 
     def snapshot(self) -> StatsSnapshot:
-        """Return a snapshot of current stats."""
+        """Return a snapshot of current stats.
+
+        The counters and per-seat mappings share the collector's live state rather
+        than copying it, so taking a snapshot every frame is cheap. The per-seat
+        mappings are read-only views.
+        """
+        self._flush()
         return StatsSnapshot(
             overall=self._overall,
             come_out=self._come_out,
             point_on=self._point_on,
-            per_shooter=dict(self._per_shooter),
-            per_player=dict(self._per_player),
+            per_shooter=MappingProxyType(self._per_shooter),
+            per_player=MappingProxyType(self._per_player),
             end_reason=self._end_reason,
             roll_count=self._roll_count,
             points_made=self._points_made,
         )
+
+    def _flush(self) -> None:
+        """Fold buffered rolls into the overall, phase, shooter, and player counters.
+
+        Each roll is recorded once, into a bucket for its shooter and phase. The
+        buckets are then merged into every scope they belong to, so the
+        per-roll work does not grow with the number of scopes.
+        """
+        if not self._pending_results:
+            return
+        come_out_buckets: Dict[int, StatsCounters] = {}
+        point_on_buckets: Dict[int, StatsCounters] = {}
+        come_out = _COME_OUT
+        current_shooter = -1
+        record_come_out = record_point_on = StatsCounters().record
+        for roll_result, shooter_index in zip(self._pending_results, self._pending_shooters):
+            if shooter_index != current_shooter:
+                record_come_out = come_out_buckets.setdefault(shooter_index, StatsCounters()).record
+                record_point_on = point_on_buckets.setdefault(shooter_index, StatsCounters()).record
+                current_shooter = shooter_index
+            if roll_result.phase_before is come_out:
+                record_come_out(roll_result)
+            else:
+                record_point_on(roll_result)
+        self._pending_results.clear()
+        self._pending_shooters.clear()
+
+        batch = StatsCounters()
+        per_shooter = self._per_shooter
+        for phase_counters, buckets in ((self._come_out, come_out_buckets), (self._point_on, point_on_buckets)):
+            for shooter_index, counters in buckets.items():
+                if not counters.rolls:
+                    continue
+                phase_counters.merge(counters)
+                batch.merge(counters)
+                if shooter_index not in per_shooter:
+                    per_shooter[shooter_index] = StatsCounters()
+                per_shooter[shooter_index].merge(counters)
+
+        self._overall.merge(batch)
+        table = self._pending_table
+        if table is None:
+            return
+        for seat_index, seat in enumerate(table.seats):
+            if seat is None:
+                continue
+            if seat_index not in self._per_player:
+                self._per_player[seat_index] = StatsCounters()
+            self._per_player[seat_index].merge(batch)
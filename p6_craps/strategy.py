@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Protocol
 
 from p6_craps.enums import PassLineOutcome
@@ -20,7 +21,9 @@ class BettingState:
     last_outcome: Optional[PassLineOutcome] = None
 
     def __post_init__(self) -> None:
-        """Validate betting state."""
+        """Validate betting state (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if self.bankroll < 0:
             raise ValueError("bankroll must be non-negative")
         if self.base_bet <= 0:
@@ -43,13 +46,21 @@ class BetDecision:
     reason: str
 
     def __post_init__(self) -> None:
-        """Validate bet decision."""
+        """Validate bet decision (skipped under ``python -O``)."""
+        if not __debug__:
+            return
         if self.amount < 0:
             raise ValueError("amount must be non-negative")
         if not self.reason.strip():
             raise ValueError("reason must be non-empty")
 
 
+@lru_cache(maxsize=1024)
+def _bet_decision(amount: int, reason: str) -> BetDecision:
+    """Return a shared decision; decisions are immutable, so equal ones can be reused."""
+    return BetDecision(amount=amount, reason=reason)
+
+
 class BettingStrategy(Protocol):
     """Protocol for betting strategies."""
 
@@ -64,7 +75,7 @@ class FlatBetStrategy:
     def next_bet(self, state: BettingState) -> BetDecision:
         """Return a flat bet, capped by bankroll."""
         amount = min(state.base_bet, state.bankroll)
-        return BetDecision(amount=amount, reason="flat bet")
+        return _bet_decision(amount, "flat bet")
 
 
 @dataclass(slots=True, frozen=True)
@@ -73,10 +84,10 @@ class MartingaleStrategy:
 
     def next_bet(self, state: BettingState) -> BetDecision:
         """Return a martingale bet based on consecutive losses."""
-        bet = state.base_bet * (2**state.consecutive_losses)
+        bet = state.base_bet << state.consecutive_losses
         cap = state.max_bet if state.max_bet is not None else bet
         amount = min(bet, cap, state.bankroll)
-        return BetDecision(amount=amount, reason="martingale")
+        return _bet_decision(amount, "martingale")
 
 
 @dataclass(slots=True, frozen=True)
@@ -85,7 +96,7 @@ class ParoliStrategy:
 
     def next_bet(self, state: BettingState) -> BetDecision:
         """Return a paroli bet based on consecutive wins."""
-        bet = state.base_bet * (2**state.consecutive_wins)
+        bet = state.base_bet << state.consecutive_wins
         cap = state.max_bet if state.max_bet is not None else bet
         amount = min(bet, cap, state.bankroll)
-        return BetDecision(amount=amount, reason="paroli")
+        return _bet_decision(amount, "paroli")
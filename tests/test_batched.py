@@ -0,0 +1,51 @@
+"""Tests for lockstep multi-game simulation."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from p6_craps.batched import run_lanes
+from p6_craps.dice import ReplayDice
+from p6_craps.engine import CrapsEngine
+from p6_craps.game import GameConfig
+
+
+def _play_sequentially(data: bytes, target_points: int, max_rolls: int, games: int) -> list[tuple[int, int]]:
+    dice = ReplayDice(data)
+    results = []
+    for _ in range(games):
+        engine = CrapsEngine(dice=dice)
+        rolls = 0
+        while engine.completed_points < target_points and rolls < max_rolls:
+            engine.roll()
+            rolls += 1
+        results.append((rolls, engine.completed_points))
+    return results
+
+
+def test_single_lane_matches_sequential_games() -> None:
+    """One lane should replay games exactly as the engine plays them back to back."""
+    data = bytes(random.Random(7).randrange(1, 7) for _ in range(20_000))
+    config = GameConfig(target_points=2, max_rolls=40)
+    expected = _play_sequentially(data, target_points=2, max_rolls=40, games=25)
+    assert run_lanes(config, games=25, lanes=1, dice=ReplayDice(data)) == expected
+
+
+def test_lanes_honor_stop_limits() -> None:
+    """Every game should stop exactly at one of its configured limits."""
+    config = GameConfig(target_points=3, max_rolls=50)
+    results = run_lanes(config, games=100, lanes=8, rng=random.Random(3))
+    assert len(results) == 100
+    for roll_count, points_made in results:
+        assert points_made == 3 or roll_count == 50
+        assert points_made <= 3 and roll_count <= 50
+
+
+def test_run_lanes_requires_a_limit() -> None:
+    """Lanes have no players, so a game needs a point or roll limit to end."""
+    with pytest.raises(ValueError, match="target_points or max_rolls"):
+        run_lanes(GameConfig(), games=1)
+    with pytest.raises(ValueError, match="lanes"):
+        run_lanes(GameConfig(max_rolls=1), games=1, lanes=0)
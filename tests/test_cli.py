@@ -0,0 +1,69 @@
+"""Tests for command-line orchestration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from p6_craps.cli import PARSER, CliArgs, ConfigError, load_config, main
+
+
+def test_load_config_missing_file_is_empty(tmp_path: Path) -> None:
+    """A missing config file should yield an empty config."""
+    assert load_config(str(tmp_path / "missing.json")) == {}
+
+
+def test_load_config_rejects_bad_json(tmp_path: Path) -> None:
+    """Invalid or non-object JSON should raise ConfigError."""
+    path = tmp_path / "config.json"
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ConfigError, match="Invalid JSON"):
+        load_config(str(path))
+    path.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(ConfigError, match="JSON object"):
+        load_config(str(path))
+
+
+def test_cli_args_from_args_coerces_options() -> None:
+    """CLI options should be coerced to typed values with defaults."""
+    namespace = PARSER.parse_args(["--max-rolls", "10", "--frame-delay", "0.5", "--no-clear"])
+    cli = CliArgs.from_args(vars(namespace))
+    assert cli.max_rolls == 10
+    assert cli.frame_delay == 0.5
+    assert cli.clear is False
+    assert cli.runs is None
+    assert cli.jobs == 1
+
+
+def test_cli_args_reports_every_invalid_option() -> None:
+    """All invalid options should be reported in one error."""
+    with pytest.raises(ConfigError, match="--max-rolls.*--frame-delay"):
+        CliArgs.from_args({"max_rolls": "0", "frame_delay": "-1"})
+
+
+def test_main_runs_headless_batch(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """The --runs path should print a run summary and exit cleanly."""
+    argv = ["--config", str(tmp_path / "missing.json"), "--max-rolls", "5", "--runs", "2"]
+    assert main(argv) == 0
+    assert "runs: 2" in capsys.readouterr().out
+
+
+def test_main_honors_config_render_every_when_piped(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """A config ``render_every`` should still apply when output is not a terminal."""
+    path = tmp_path / "config.json"
+    path.write_text('{"render_every": 1}', encoding="utf-8")
+    assert main(["--config", str(path), "--max-rolls", "3"]) == 0
+    assert capsys.readouterr().out.count("[overall]") == 3
+
+
+def test_main_draws_only_the_final_frame_when_piped(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Piped output with no render settings should draw just the final frame."""
+    assert main(["--config", str(tmp_path / "missing.json"), "--max-rolls", "3"]) == 0
+    assert capsys.readouterr().out.count("[overall]") == 1
+
+
+def test_parser_rejects_debug_with_verbose() -> None:
+    """--debug and --verbose should be mutually exclusive."""
+    with pytest.raises(SystemExit):
+        PARSER.parse_args(["--debug", "--verbose"])
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import dataclasses
+import pickle
 import random
+import threading
+from pathlib import Path
 
-from p6_craps.dice import Dice, Roll
-from p6_craps.engine import CrapsEngine
+import pytest
+
+from p6_craps.dice import Dice, ReplayDice, Roll, default_rng, write_roll_stream
+from p6_craps.engine import CrapsEngine, RollHistory
 from p6_craps.enums import PassLineOutcome, Phase
 
 
@@ -80,3 +86,145 @@ class TestCrapsEngine:
         roll1 = dice1.roll()
         roll2 = dice2.roll()
         assert roll1 == roll2
+
+    def test_run_batch_matches_single_rolls(self) -> None:
+        """Batched rolls should match rolling one at a time with the same seed."""
+        batched = CrapsEngine(rng=random.Random(7))
+        single = CrapsEngine(rng=random.Random(7))
+        results = batched.run_batch(50)
+        assert len(results) == 50
+        assert results == tuple(single.roll() for _ in range(50))
+        assert batched.completed_points == single.completed_points
+
+    def test_run_batch_rejects_negative(self) -> None:
+        """Batch size must be non-negative."""
+        with pytest.raises(ValueError, match="non-negative"):
+            CrapsEngine().run_batch(-1)
+
+    def test_run_history_round_trips_results(self) -> None:
+        """Roll history columns should rebuild the original results."""
+        expected = CrapsEngine(rng=random.Random(11)).run_batch(40)
+        history = CrapsEngine(rng=random.Random(11)).run_history(40)
+        assert len(history) == 40
+        assert tuple(history.get_result(i) for i in range(40)) == expected
+        assert history.get_result(-1) == expected[-1]
+
+    def test_roll_history_total_counts(self) -> None:
+        """Total histograms should match the stored results, overall and by phase."""
+        history = CrapsEngine(rng=random.Random(5)).run_history(500)
+        results = [history.get_result(i) for i in range(len(history))]
+        come_out = history.total_counts(Phase.COME_OUT)
+        assert history.total_counts() == [sum(r.roll.total == t for r in results) for t in range(13)]
+        assert come_out == [
+            sum(r.roll.total == t and r.phase_before is Phase.COME_OUT for r in results) for t in range(13)
+        ]
+        assert sum(come_out) + sum(history.total_counts(Phase.POINT_ON)) == 500
+
+    def test_roll_history_rejects_bad_index(self) -> None:
+        """Out-of-range history lookups should raise IndexError."""
+        with pytest.raises(IndexError, match="out of range"):
+            RollHistory().get_result(0)
+
+    def test_roll_total_is_not_a_dataclass_field(self) -> None:
+        """The cached total should not change the roll's dataclass shape."""
+        roll = Roll(1, 2)
+        assert roll.total == 3
+        assert dataclasses.astuple(roll) == (1, 2)
+        assert [item.name for item in dataclasses.fields(roll)] == ["d1", "d2"]
+        assert pickle.loads(pickle.dumps(roll)) == roll
+
+    def test_dice_rolls_cover_all_outcomes(self) -> None:
+        """Buffered dice should refill across blocks and produce every outcome."""
+        dice = Dice(rng=random.Random(3), block_size=4)
+        rolls = {dice.roll() for _ in range(2000)}
+        assert len(rolls) == 36
+
+    def test_default_rng_is_shared_per_thread(self) -> None:
+        """Unseeded engines share one RNG per thread instead of seeding a new one."""
+        rng = default_rng()
+        assert default_rng() is rng
+        others: list[random.Random] = []
+        worker = threading.Thread(target=lambda: others.append(default_rng()))
+        worker.start()
+        worker.join()
+        assert others[0] is not rng
+
+    def test_dice_roll_total_follows_the_same_stream(self) -> None:
+        """roll_total should return the totals roll would have produced."""
+        rolls = Dice(rng=random.Random(9), block_size=7)
+        totals = Dice(rng=random.Random(9), block_size=7)
+        assert [totals.roll_total() for _ in range(50)] == [rolls.roll().total for _ in range(50)]
+
+    def test_dice_rejects_non_positive_block_size(self) -> None:
+        """Block size must be positive."""
+        with pytest.raises(ValueError, match="block_size"):
+            Dice(rng=random.Random(), block_size=0)
+
+    @pytest.mark.parametrize(
+        ("d1", "d2", "expected"),
+        [
+            (1, 2, PassLineOutcome.LOSS),
+            (6, 6, PassLineOutcome.LOSS),
+            (5, 6, PassLineOutcome.WIN),
+            (4, 6, PassLineOutcome.PUSH),
+        ],
+    )
+    def test_come_out_classification(self, d1: int, d2: int, expected: PassLineOutcome) -> None:
+        """Come-out totals should map to the expected pass line outcome."""
+        result = CrapsEngine().apply_roll(Roll(d1=d1, d2=d2))
+        assert result.pass_line_outcome == expected
+
+    def test_engine_has_no_instance_dict(self) -> None:
+        """Engine state should live in slots rather than a per-instance dict."""
+        engine = CrapsEngine()
+        assert not hasattr(engine, "__dict__")
+
+    @pytest.mark.parametrize(("d1", "d2"), [(0, 3), (3, 7)])
+    @pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
+    def test_roll_rejects_out_of_range_dice(self, d1: int, d2: int) -> None:
+        """Die values outside 1-6 should be rejected."""
+        with pytest.raises(ValueError, match="between 1 and 6"):
+            Roll(d1=d1, d2=d2)
+
+    @pytest.mark.parametrize("point", [None, 4])
+    def test_apply_roll_rejects_invalid_total(self, point: int | None) -> None:
+        """Totals outside 2-12 should raise instead of producing a point."""
+        roll = object.__new__(Roll)
+        for name, value in (("d1", 0), ("d2", 1), ("total", 1)):
+            object.__setattr__(roll, name, value)
+        engine = CrapsEngine()
+        if point is not None:
+            engine.apply_roll(Roll(d1=2, d2=2))
+        with pytest.raises(ValueError, match="Invalid roll total 1"):
+            engine.apply_roll(roll)
+        assert engine.point == point
+
+
+class TestReplayDice:
+    """Test suite for recorded roll streams."""
+
+    def test_round_trips_recorded_rolls(self, tmp_path: Path) -> None:
+        """A written stream should replay the same rolls through the engine."""
+        path = tmp_path / "rolls.bin"
+        write_roll_stream(path, Dice(rng=random.Random(5)), 25)
+        with ReplayDice.from_file(path) as replay:
+            assert len(replay) == 25
+            expected = CrapsEngine(rng=random.Random(5)).run_batch(25)
+            assert CrapsEngine(dice=replay).run_batch(25) == expected
+            with pytest.raises(IndexError, match="exhausted"):
+                replay.roll()
+        assert replay.data.closed  # type: ignore[union-attr]
+
+    def test_empty_stream_is_exhausted(self, tmp_path: Path) -> None:
+        """An empty file should load but have no rolls."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with pytest.raises(IndexError, match="exhausted"):
+            CrapsEngine(dice=ReplayDice.from_file(path)).roll()
+
+    def test_rejects_malformed_streams(self) -> None:
+        """Odd-length streams and illegal die values should be rejected."""
+        with pytest.raises(ValueError, match="even"):
+            ReplayDice(data=b"\x01")
+        with pytest.raises(ValueError, match="invalid dice"):
+            ReplayDice(data=b"\x01\x07").roll()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import pytest
+
 from p6_craps.dice import Roll
+from p6_craps.enums import PassLineOutcome
 from p6_craps.game import Game, GameConfig, GameStopReason, PlayerState
-from p6_craps.models import Bankroll, Player
+from p6_craps.models import Bankroll, Player, Table
+from p6_craps.stats import TableStatsCollector
 
 
 class SequenceDice:
@@ -62,6 +66,16 @@ def test_stop_on_max_rolls() -> None:
     assert game.step().stop_reason == GameStopReason.MAX_ROLLS_REACHED
 
 
+def test_stop_with_both_limits_prefers_target_points() -> None:
+    """With both limits set, reaching the target points wins over the roll limit."""
+    players = (PlayerState(player=_player("A", 100)),)
+    config = GameConfig(target_points=1, max_rolls=2)
+    game = Game.from_players(players=players, dice=SequenceDice([Roll(2, 2), Roll(2, 2)]), config=config)
+    assert game.run().stop_reason == GameStopReason.TARGET_POINTS_REACHED
+    game = Game.from_players(players=players, dice=SequenceDice([Roll(2, 2), Roll(3, 3)]), config=config)
+    assert game.run().stop_reason == GameStopReason.MAX_ROLLS_REACHED
+
+
 def test_stop_conditions_from_player_states() -> None:
     """Stop conditions react to player bankroll and max win status."""
     rolls = [Roll(3, 4)]
@@ -86,3 +100,114 @@ def test_stop_conditions_from_player_states() -> None:
     only_non_shooter = [PlayerState(player=_player("A", 50), can_shoot=False)]
     _replace_players(game, only_non_shooter)
     assert game.check_stop() == GameStopReason.ONLY_NON_SHOOTER_LEFT
+
+
+def test_run_steps_until_stop_or_limit() -> None:
+    """Run should stop at a stop condition or after max_steps rolls."""
+    rolls = [Roll(2, 2), Roll(3, 3), Roll(2, 2), Roll(3, 4)]
+    players = (PlayerState(player=_player("A", 100)),)
+    game = Game.from_players(players=players, dice=SequenceDice(rolls), config=GameConfig(target_points=1))
+    partial = game.run(max_steps=2)
+    assert partial.roll_count == 2
+    assert partial.stop_reason is None
+    final = game.run()
+    assert final.roll_count == 3
+    assert final.stop_reason == GameStopReason.TARGET_POINTS_REACHED
+
+
+def test_run_until_decision_stops_on_win_or_loss() -> None:
+    """Run with until_decision should stop on the first pass line win or loss."""
+    rolls = [Roll(2, 2), Roll(3, 3), Roll(3, 4), Roll(5, 6)]
+    players = (PlayerState(player=_player("A", 100)), PlayerState(player=_player("B", 100)))
+    game = Game.from_players(players=players, dice=SequenceDice(rolls))
+    step = game.run(until_decision=True)
+    assert step.roll_count == 3
+    assert step.roll_result.pass_line_outcome == PassLineOutcome.LOSS
+    assert step.stop_reason is None
+    assert game.run(until_decision=True).roll_count == 4
+
+
+def test_shooter_keeps_dice_after_come_out_craps() -> None:
+    """Come-out craps loses the pass line but does not rotate the shooter."""
+    dice = SequenceDice([Roll(1, 1), Roll(3, 4)])
+    players = (
+        PlayerState(player=_player("A", 100)),
+        PlayerState(player=_player("B", 100)),
+    )
+    game = Game.from_players(players=players, dice=dice)
+    assert game.step().shooter_index == 0
+    assert game.step().shooter_index == 0
+
+
+def test_shooter_rotation_skips_ineligible_seats() -> None:
+    """Rotation should wrap around and skip non-shooters and broke players."""
+    dice = SequenceDice([Roll(3, 3), Roll(3, 4), Roll(3, 3), Roll(3, 4)])
+    players = (
+        PlayerState(player=_player("A", 100)),
+        PlayerState(player=_player("B", 100), can_shoot=False),
+        PlayerState(player=_player("C", 100)),
+    )
+    game = Game.from_players(players=players, dice=dice)
+    game.step()
+    assert game.step().shooter_index == 2
+    game.update_player_state(0, PlayerState(player=_player("A", 0)))
+    game.update_player_state(2, PlayerState(player=_player("C", 50)))
+    game.step()
+    assert game.step().shooter_index == 2
+
+
+def test_update_player_state_refreshes_stop_conditions() -> None:
+    """Cached seat eligibility should follow bankroll updates."""
+    players = (
+        PlayerState(player=_player("A", 100, max_win=150)),
+        PlayerState(player=_player("B", 100), can_shoot=False),
+    )
+    game = Game.from_players(players=players, dice=SequenceDice([]))
+    assert game.check_stop() is None
+    assert game.wagering_mask() == 0b11
+    game.update_player_state(0, PlayerState(player=_player("A", 150, max_win=150)))
+    assert game.check_stop() == GameStopReason.ONLY_NON_SHOOTER_LEFT
+    assert game.wagering_mask() == 0b10
+    game.update_player_state(1, PlayerState(player=_player("B", 0), can_shoot=False))
+    assert game.check_stop() == GameStopReason.ALL_MAX_WIN_REACHED
+    game.update_player_state(0, PlayerState(player=_player("A", 0, max_win=150)))
+    assert game.check_stop() == GameStopReason.NO_BANKROLL_REMAINING
+
+
+def test_first_shooter_skips_non_shooters() -> None:
+    """The first shooter is the lowest seat that can shoot and wager."""
+    players = (
+        PlayerState(player=_player("A", 100), can_shoot=False),
+        PlayerState(player=_player("B", 0)),
+        PlayerState(player=_player("C", 100)),
+    )
+    assert Game.from_players(players=players, dice=SequenceDice([])).shooter_index == 2
+
+
+def test_run_batches_stats_like_step() -> None:
+    """Run should hand stats over in batches that match per-step recording."""
+    rolls = [Roll(2, 2), Roll(3, 4), Roll(1, 1), Roll(4, 4), Roll(4, 4)]
+    players = (PlayerState(player=_player("A", 100)), PlayerState(player=_player("B", 100)))
+    config = GameConfig(target_points=1)
+    stepped_stats = TableStatsCollector()
+    stepped = Game.from_players(players=players, dice=SequenceDice(rolls), config=config, stats=stepped_stats)
+    while stepped.step().stop_reason is None:
+        pass
+    run_stats = TableStatsCollector()
+    Game.from_players(players=players, dice=SequenceDice(rolls), config=config, stats=run_stats).run()
+    assert run_stats.snapshot() == stepped_stats.snapshot()
+    assert run_stats.snapshot().per_shooter[1].rolls == 3
+
+
+@pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
+def test_game_rejects_mismatched_seating() -> None:
+    """Player states must line up with the table's seats."""
+    state = PlayerState(player=_player("A", 100))
+    table = Table.empty().seat_player(0, state.player)
+    with pytest.raises(ValueError, match="exactly 9"):
+        Game(table=table, player_states=(state,))
+    with pytest.raises(ValueError, match="empty seats"):
+        Game(table=table, player_states=(state, state) + (None,) * 7)
+    other = PlayerState(player=_player("B", 100))
+    with pytest.raises(ValueError, match="match table seats"):
+        Game(table=table, player_states=(other,) + (None,) * 8)
@@ -0,0 +1,53 @@
+"""Tests for the integer-only headless game kernel."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from p6_craps import kernel
+from p6_craps.game import GameConfig, PlayerState
+from p6_craps.models import Bankroll, Player
+from p6_craps.simulate import _play_headless, players_from_config
+from p6_craps.strategy import BetDecision, BettingState
+
+_TABLE = {
+    "players": [
+        {"name": "A", "bankroll": 60, "strategy": "martingale", "max_bet": 40},
+        {"name": "B", "bankroll": 60, "strategy": "paroli", "max_win": 90, "can_shoot": False},
+        {"name": "C", "bankroll": 25, "max_win": 40},
+    ]
+}
+
+
+class _AllInStrategy:
+    def next_bet(self, state: BettingState) -> BetDecision:
+        return BetDecision(amount=state.bankroll, reason="all in")
+
+
+@pytest.mark.parametrize(
+    "config",
+    [GameConfig(), GameConfig(target_points=4), GameConfig(max_rolls=60), GameConfig(target_points=3, max_rolls=40)],
+)
+def test_kernel_matches_object_game(config: GameConfig) -> None:
+    """Seeded kernel runs should match the object-based betting loop roll for roll."""
+    players = players_from_config(_TABLE)
+    for seed in range(40):
+        game, _ = _play_headless(players, config, random.Random(seed))
+        assert kernel.play(players, config, random.Random(seed)) == game.snapshot()
+
+
+def test_kernel_supports_only_built_in_strategies() -> None:
+    """Custom strategies fall back to the object path."""
+    players = players_from_config(_TABLE)
+    assert kernel.supports(players)
+    custom = PlayerState(player=Player(name="D", bankroll=Bankroll(balance=10)), strategy=_AllInStrategy())
+    assert not kernel.supports(players + (custom,))
+
+
+def test_kernel_requires_a_shooter() -> None:
+    """Like Game, the kernel needs at least one seat that can shoot and wager."""
+    players = players_from_config({"players": [{"name": "A", "bankroll": 10, "can_shoot": False}]})
+    with pytest.raises(ValueError, match="No eligible shooters"):
+        kernel.play(players, GameConfig(max_rolls=1))
@@ -10,11 +10,13 @@ from p6_craps.models import Bankroll, Player, Table
 class TestBankroll:
     """Test suite for Bankroll."""
 
+    @pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
     def test_rejects_negative_balance(self) -> None:
         """Bankroll balance must be non-negative."""
         with pytest.raises(ValueError, match="negative"):
             Bankroll(balance=-1)
 
+    @pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
     def test_rejects_non_positive_max_win(self) -> None:
         """Max win must be positive when provided."""
         with pytest.raises(ValueError, match="max_win"):
@@ -30,6 +32,7 @@ class TestBankroll:
 class TestPlayer:
     """Test suite for Player."""
 
+    @pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
     def test_rejects_empty_name(self) -> None:
         """Player name must be non-empty."""
         with pytest.raises(ValueError, match="name"):
@@ -66,3 +69,21 @@ class TestTable:
         seated = table.seat_player(0, player)
         with pytest.raises(ValueError, match="occupied"):
             seated.seat_player(0, player)
+
+
+def test_bankroll_apply_keeps_max_win_and_rejects_overdraw() -> None:
+    """Applying a delta keeps max_win and cannot overdraw."""
+    bankroll = Bankroll(balance=10, max_win=50)
+    assert bankroll.apply(15) == Bankroll(balance=25, max_win=50)
+    with pytest.raises(ValueError, match="negative"):
+        bankroll.apply(-11)
+
+
+def test_table_from_seats_pads_open_seats() -> None:
+    """from_seats should keep seat order and fill the rest with open seats."""
+    player = Player(name="Shooter", bankroll=Bankroll(balance=100))
+    table = Table.from_seats([player, None, player])
+    assert table.seats[:3] == (player, None, player)
+    assert table.seats[3:] == (None,) * 6
+    with pytest.raises(ValueError, match="more than 9"):
+        Table.from_seats([player] * 10)
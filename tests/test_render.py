@@ -5,7 +5,7 @@ from __future__ import annotations
 from p6_craps.dice import Roll
 from p6_craps.engine import CrapsEngine
 from p6_craps.models import Bankroll, Player, Table
-from p6_craps.render import render_stats
+from p6_craps.render import render_run_summary, render_stats
 from p6_craps.stats import TableStatsCollector
 
 
@@ -26,3 +26,24 @@ def test_render_includes_sections_and_totals() -> None:
     assert "die 2" in output
     assert "point est" in output
     assert "[shooter 0]" in output
+
+
+def test_render_run_summary_reports_totals_and_means() -> None:
+    """Run summaries should show totals and per-run means."""
+    output = render_run_summary([(10, 1), (20, 3)])
+    assert "runs: 2" in output
+    assert "rolls: 30 (mean 15.00)" in output
+    assert "points: 4 (mean 2.00)" in output
+
+
+def test_render_totals_use_fixed_key_order() -> None:
+    """Totals, dice, and point rows should list every key in ascending order."""
+    table = Table.empty().seat_player(0, Player(name="A", bankroll=Bankroll(balance=100)))
+    collector = TableStatsCollector()
+    collector.record_game_start(table)
+    collector.record_roll(CrapsEngine().apply_roll(Roll(2, 3)), shooter_index=0, roll_count=1, table=table)
+
+    output = render_stats(collector.snapshot())
+    assert "totals     2=0 3=0 4=0 5=1 6=0 7=0 8=0 9=0 10=0 11=0 12=0" in output
+    assert "die 1      1=0 2=1 3=0 4=0 5=0 6=0" in output
+    assert "point est  4=0 5=1 6=0 8=0 9=0 10=0" in output
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import io
+import os
+import shutil
+import sys
+import time
+
+import pytest
+
+from p6_craps.dice import ReplayDice
 from p6_craps.game import GameConfig, PlayerState
 from p6_craps.models import Bankroll, Player
 from p6_craps.simulate import (
+    SimulationConfig,
     game_config_from_config,
     players_from_config,
+    run_many,
+    run_many_stats,
+    run_simulation,
     run_until_complete,
     simulation_config_from_config,
 )
+from p6_craps.strategy import ParoliStrategy
 
 
 def _player(name: str, bankroll: int, max_win: int | None = None) -> PlayerState:
@@ -32,6 +46,13 @@ def test_run_until_complete_stops_on_target_points() -> None:
     assert rolls >= 1
 
 
+def test_run_until_complete_replays_a_roll_stream() -> None:
+    """A replayed dice stream should drive the game roll for roll."""
+    players = (_player("A", 1000),)
+    replay = ReplayDice(data=bytes((3, 1, 2, 2)))  # point of 4, then made
+    assert run_until_complete(players, GameConfig(target_points=1), dice=replay) == (2, 1)
+
+
 def test_players_from_config_defaults() -> None:
     """Config should return default players when not provided."""
     players = players_from_config({})
@@ -52,6 +73,19 @@ def test_players_from_config_custom() -> None:
     assert players[1].can_shoot is False
 
 
+def test_players_from_config_resolves_strategy_names() -> None:
+    """Strategy names are case-insensitive, share one instance per name, and reject unknowns."""
+    entries = [
+        {"name": "A", "bankroll": 10, "strategy": " Paroli "},
+        {"name": "B", "bankroll": 10, "strategy": "paroli"},
+    ]
+    players = players_from_config({"players": entries})
+    assert isinstance(players[0].strategy, ParoliStrategy)
+    assert players[0].strategy is players[1].strategy
+    with pytest.raises(ValueError, match="Unknown strategy 'Nope'"):
+        players_from_config({"players": [{"name": "A", "bankroll": 10, "strategy": "Nope"}]})
+
+
 def test_game_config_from_config() -> None:
     """Game config should honor overrides and defaults."""
     config = {"target_points": 2, "max_rolls": 10}
@@ -68,3 +102,128 @@ def test_simulation_config_from_config() -> None:
     sim_config = simulation_config_from_config(config, frame_delay=0.0, clear=True)
     assert sim_config.frame_delay == 0.5
     assert sim_config.clear is False
+
+
+def test_simulation_config_render_every() -> None:
+    """Render cadence should honor CLI overrides, config, and final frames."""
+    assert simulation_config_from_config({}, frame_delay=0.0, clear=True).render_every == 1
+    from_config = simulation_config_from_config({"render_every": 0}, frame_delay=0.0, clear=True)
+    assert from_config.render_every == 0
+    override = simulation_config_from_config({"render_every": 0}, frame_delay=0.0, clear=True, render_every=3)
+    assert override.should_render(3, final=False) is True
+    assert override.should_render(4, final=False) is False
+    assert from_config.should_render(4, final=False) is False
+    assert from_config.should_render(4, final=True) is True
+
+
+def test_simulation_config_piped_default_render_every() -> None:
+    """Non-interactive output defaults to the final frame only unless a delay or setting says otherwise."""
+    assert simulation_config_from_config({}, frame_delay=0.0, clear=True, interactive=False).render_every == 0
+    assert simulation_config_from_config({}, frame_delay=0.1, clear=True, interactive=False).render_every == 1
+    delayed = simulation_config_from_config({"frame_delay": 0.05}, frame_delay=0.0, clear=True, interactive=False)
+    assert delayed.render_every == 1
+    configured = simulation_config_from_config({"render_every": 2}, frame_delay=0.0, clear=True, interactive=False)
+    assert configured.render_every == 2
+
+
+def test_run_simulation_writes_plain_frames_when_not_a_tty(capsys: pytest.CaptureFixture[str]) -> None:
+    """Non-terminal output should skip ANSI clears and render each frame once."""
+    players = (_player("A", 1000),)
+    assert run_simulation(players, GameConfig(max_rolls=3), SimulationConfig(clear=True)) == 0
+    output = capsys.readouterr().out
+    assert "\033[" not in output
+    assert output.count("[overall]") == 3
+
+
+def test_run_simulation_redraws_only_changed_lines_on_a_tty(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Terminal frames after the first should rewrite only the lines that changed."""
+
+    class _Terminal(io.StringIO):
+        def isatty(self) -> bool:
+            return True
+
+    terminal = _Terminal()
+    monkeypatch.setattr(sys, "stdout", terminal)
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda: os.terminal_size((80, 200)))
+    players = (_player("A", 1000),)
+    assert run_simulation(players, GameConfig(max_rolls=3), SimulationConfig(clear=True)) == 0
+    output = terminal.getvalue()
+    assert output.count("\033[H\033[0J") == 1
+    assert output.count("[overall]") == 1
+    assert output.endswith("\033[0J")
+
+
+def test_run_simulation_redraws_full_frames_taller_than_the_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Frames that do not fit on screen should be redrawn in full rather than diffed by row."""
+
+    class _Terminal(io.StringIO):
+        def isatty(self) -> bool:
+            return True
+
+    terminal = _Terminal()
+    monkeypatch.setattr(sys, "stdout", terminal)
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda: os.terminal_size((80, 10)))
+    players = (_player("A", 1000),)
+    assert run_simulation(players, GameConfig(max_rolls=3), SimulationConfig(clear=True)) == 0
+    output = terminal.getvalue()
+    assert output.count("\033[H\033[0J") == 3
+    assert output.count("[overall]") == 3
+    assert ";1H" not in output
+
+
+def test_run_simulation_paces_frames_without_drift(capsys: pytest.CaptureFixture[str]) -> None:
+    """Frame delays should follow a fixed schedule from the start of the run."""
+    players = (_player("A", 1000),)
+    started = time.perf_counter()
+    run_simulation(players, GameConfig(max_rolls=20), SimulationConfig(clear=False, frame_delay=0.002))
+    elapsed = time.perf_counter() - started
+    capsys.readouterr()
+    assert 0.038 <= elapsed < 0.5
+
+
+def test_run_simulation_pauses_only_after_drawn_frames(capsys: pytest.CaptureFixture[str]) -> None:
+    """Rolls that draw no frame should not wait out the frame delay."""
+    players = (_player("A", 1000),)
+    started = time.perf_counter()
+    run_simulation(players, GameConfig(max_rolls=20), SimulationConfig(clear=False, frame_delay=0.05, render_every=10))
+    elapsed = time.perf_counter() - started
+    assert capsys.readouterr().out.count("[overall]") == 2
+    assert 0.05 <= elapsed < 0.3
+
+
+def test_run_many_is_deterministic_across_jobs() -> None:
+    """Seeded runs should give the same results serially and in parallel."""
+    players = (_player("A", 1000),)
+    config = GameConfig(max_rolls=50)
+    serial = run_many(players, config, seeds=range(4), jobs=1)
+    parallel = run_many(players, config, seeds=range(4), jobs=2)
+    assert serial == parallel
+    assert all(rolls == 50 for rolls, _ in serial)
+
+
+def test_run_many_keeps_seed_order_across_chunks() -> None:
+    """Chunked parallel runs, including one worker per CPU, should match serial seed order."""
+    players = (_player("A", 1000), _player("B", 1000))
+    config = GameConfig(target_points=2, max_rolls=200)
+    serial = run_many(players, config, seeds=range(11), jobs=1)
+    assert run_many(players, config, seeds=range(11), jobs=2) == serial
+    assert run_many(players, config, seeds=range(11), jobs=None) == serial
+
+
+def test_run_many_rejects_non_positive_jobs() -> None:
+    """Worker count must be positive."""
+    with pytest.raises(ValueError, match="jobs"):
+        run_many((_player("A", 1000),), GameConfig(max_rolls=1), seeds=[0], jobs=0)
+
+
+def test_run_many_stats_merges_games() -> None:
+    """Merged stats should sum rolls and points across every seeded game."""
+    players = (_player("A", 1000), _player("B", 1000))
+    config = GameConfig(max_rolls=30)
+    results = run_many(players, config, seeds=range(3))
+    merged = run_many_stats(players, config, seeds=range(3), jobs=2)
+    assert merged.roll_count == sum(rolls for rolls, _ in results) == 90
+    assert merged.points_made == sum(points for _, points in results)
+    assert merged.overall.rolls == 90
+    assert merged.per_player[1].rolls == 90
+    assert merged.end_reason is None
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from p6_craps.dice import Roll
@@ -40,6 +42,41 @@ def test_stats_counters_record_rolls() -> None:
     assert counters.outcomes.win == 1
 
 
+def test_count_to_dict_uses_valid_keys_only() -> None:
+    """to_dict should map totals, faces, and points to counts without unused slots."""
+    engine = CrapsEngine()
+    counters = StatsCounters()
+    counters.record(engine.apply_roll(Roll(1, 3)))
+
+    roll_counts = counters.roll_counts.to_dict()
+    assert list(roll_counts["totals"]) == list(range(2, 13))
+    assert roll_counts["totals"][4] == 1
+    assert roll_counts["die_one"] == {1: 1, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
+    assert roll_counts["die_two"][3] == 1
+    assert counters.point_counts.to_dict() == {
+        "established": {4: 1, 5: 0, 6: 0, 8: 0, 9: 0, 10: 0},
+        "made": {4: 0, 5: 0, 6: 0, 8: 0, 9: 0, 10: 0},
+    }
+
+
+def test_snapshot_merge_leaves_source_collector_unchanged() -> None:
+    """Merging into a live snapshot should not change the collector it came from."""
+    table = Table.empty().seat_player(0, _player("A"))
+    collector = TableStatsCollector()
+    collector.record_game_start(table)
+    collector.record_roll(CrapsEngine().apply_roll(Roll(3, 4)), shooter_index=0, roll_count=1, table=table)
+
+    snapshot = collector.snapshot()
+    snapshot.merge(collector.snapshot())
+    assert snapshot.overall.rolls == 2
+    assert snapshot.per_player[0].rolls == 2
+    after = collector.snapshot()
+    assert after.overall.rolls == 1
+    assert after.come_out.rolls == 1
+    assert after.per_shooter[0].rolls == 1
+    assert after.per_player[0].rolls == 1
+
+
 def test_table_stats_collector_scopes() -> None:
     """TableStatsCollector should split overall and phase stats."""
     table = Table.empty().seat_player(0, _player("A")).seat_player(1, _player("B"))
@@ -57,6 +94,12 @@ def test_table_stats_collector_scopes() -> None:
     assert snapshot.per_shooter[1].rolls == 1
     assert snapshot.per_player[0].rolls == 1
     assert snapshot.per_player[1].rolls == 1
+    with pytest.raises(TypeError):
+        snapshot.per_shooter[2] = StatsCounters()  # type: ignore[index]
+    restored = pickle.loads(pickle.dumps(snapshot))
+    assert restored.overall == snapshot.overall
+    assert restored.per_shooter == dict(snapshot.per_shooter)
+    assert restored.per_player == dict(snapshot.per_player)
 
 
 def test_table_stats_collector_end_reason() -> None:
@@ -80,3 +123,42 @@ def test_table_stats_collector_rejects_empty_shooter() -> None:
     result = engine.apply_roll(Roll(3, 4))
     with pytest.raises(ValueError, match="Shooter seat"):
         collector.record_roll(result, shooter_index=0, roll_count=1, table=table)
+
+
+def test_table_stats_collector_batch_rejects_empty_shooter() -> None:
+    """Batched rolls from empty shooter seats should be rejected before buffering."""
+    table = Table.empty()
+    collector = TableStatsCollector()
+    collector.record_game_start(table)
+    result = CrapsEngine().apply_roll(Roll(3, 4))
+    with pytest.raises(ValueError, match="Shooter seat"):
+        collector.record_roll_batch([result], [0], roll_count=1, table=table)
+    assert collector.snapshot().overall.rolls == 0
+
+
+def test_table_stats_collector_batches_match_per_roll_counts() -> None:
+    """Batched flushes should produce the same counters as recording every roll."""
+    table = Table.empty().seat_player(0, _player("A")).seat_player(2, _player("B"))
+    collector = TableStatsCollector(flush_size=3)
+    collector.record_game_start(table)
+    engine = CrapsEngine()
+    expected = StatsCounters()
+    rolls = [Roll(2, 2), Roll(1, 2), Roll(2, 2), Roll(3, 4), Roll(5, 5), Roll(3, 4), Roll(6, 6)]
+    for roll_count, roll in enumerate(rolls, start=1):
+        result = engine.apply_roll(roll)
+        expected.record(result)
+        collector.record_roll(result, shooter_index=0, roll_count=roll_count, table=table)
+
+    snapshot = collector.snapshot()
+    assert snapshot.overall == expected
+    assert snapshot.per_player[0] == expected
+    assert snapshot.per_player[2] == expected
+    assert snapshot.per_shooter[0] == expected
+    assert snapshot.come_out.rolls + snapshot.point_on.rolls == len(rolls)
+    assert snapshot.roll_count == len(rolls)
+
+
+def test_table_stats_collector_rejects_non_positive_flush_size() -> None:
+    """Flush size must be positive."""
+    with pytest.raises(ValueError, match="flush_size"):
+        TableStatsCollector(flush_size=0)
@@ -13,6 +13,7 @@ from p6_craps.strategy import (
 )
 
 
+@pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
 def test_betting_state_validation() -> None:
     """Betting state should validate inputs."""
     with pytest.raises(ValueError, match="bankroll"):
@@ -29,6 +30,7 @@ def test_betting_state_validation() -> None:
         BettingState(bankroll=10, base_bet=5, consecutive_losses=-1)
 
 
+@pytest.mark.skipif(not __debug__, reason="validation is skipped under -O")
 def test_bet_decision_validation() -> None:
     """Bet decisions should validate amount and reason."""
     with pytest.raises(ValueError, match="amount"):
@@ -83,3 +85,12 @@ def test_paroli_respects_bankroll() -> None:
     state = BettingState(bankroll=7, base_bet=5, consecutive_wins=2)
     decision = strategy.next_bet(state)
     assert decision.amount == 7
+
+
+def test_equal_decisions_are_shared() -> None:
+    """Repeated bets of the same amount should reuse one decision."""
+    strategy = FlatBetStrategy()
+    state = BettingState(bankroll=100, base_bet=5)
+    first = strategy.next_bet(state)
+    assert strategy.next_bet(state) is first
+    assert first == BetDecision(amount=5, reason="flat bet")